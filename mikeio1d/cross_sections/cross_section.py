@@ -23,6 +23,7 @@ from .enums import ResistanceDistribution
 from .enums import ProcessLevelsMethod
 
 from ..various import try_import_shapely
+from ..dotnet import asNumpyArray
 
 import System
 from DHI.Mike1D.CrossSectionModule import CrossSectionPoint
@@ -35,6 +36,28 @@ from DHI.Mike1D.Generic import ZLocation
 from DHI.Mike1D.Generic.Spatial.Geometry import Coordinate
 from DHI.Mike1D.Generic.Spatial.Geometry import CoordinateList
 
+try:
+    from DHI.Mike1D.MikeIO import CrossSectionPointsCopier
+except ImportError:  # pragma: no cover
+    CrossSectionPointsCopier = None
+
+
+def _point_coordinates(points) -> Tuple[np.ndarray, np.ndarray]:
+    """X and Z coordinates of a list of .NET cross section points as NumPy arrays."""
+    if CrossSectionPointsCopier is not None:
+        x = asNumpyArray(CrossSectionPointsCopier.GetXValues(points))
+        z = asNumpyArray(CrossSectionPointsCopier.GetZValues(points))
+        return x, z
+
+    points = list(points)
+    x = np.empty(len(points), dtype=np.float64)
+    z = np.empty(len(points), dtype=np.float64)
+    # Read both coordinates of each point in a single pass over the points.
+    for i, point in enumerate(points):
+        x[i] = point.X
+        z[i] = point.Z
+    return x, z
+
 
 class CrossSection:
     """A cross section in MIKE 1D, uniquely identified by a location ID, chainage, and topo ID.
@@ -522,9 +545,8 @@ class CrossSection:
             markers = [m for m in base_xs.GetMarkersOfPoint(i)]
             data["markers"].append(",".join(str(m) for m in markers))
             data["marker_labels"].append(",".join(Marker.pretty(m) for m in markers))
-            data["x"].append(point.X)
-            data["z"].append(point.Z)
             data["resistance"].append(point.DistributedResistance)
+        data["x"], data["z"] = _point_coordinates(base_xs.Points)
 
         return pd.DataFrame(data)
 
@@ -552,8 +574,8 @@ class CrossSection:
             base_xs.Points.Add(point)
 
         markers_seen = set()
-        for i, point in enumerate(base_xs.Points):
-            markers_str = df.markers.iloc[i]
+        # The points were added from the rows of df, so the markers are read from df directly.
+        for i, markers_str in enumerate(df.markers.tolist()):
             if not markers_str:
                 continue
 
@@ -693,7 +715,7 @@ class CrossSection:
         """
         base_xs = self._m1d_cross_section.BaseCrossSection
         points = base_xs.Points
-        points_coords = np.array(tuple((p.X, p.Z) for p in points))
+        points_coords = np.column_stack(_point_coordinates(points))
         if z is None:
             distances = np.abs(points_coords[:, 0] - x)
         else:
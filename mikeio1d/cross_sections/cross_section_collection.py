@@ -75,6 +75,7 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
         self._cross_section_map: dict[tuple[LocationId, Chainage, TopoId], CrossSection] = {}
         self._cross_section_data = CrossSectionData()
         self._cross_section_data_factory = CrossSectionDataFactory()
+        self._invalidate_caches()
 
         if cross_sections is None:
             return
@@ -95,6 +96,7 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
 
     def _init_from_cross_section_data(self, cross_section_data: CrossSectionData):
         """Initialize the collection from a .NET CrossSectionData object."""
+        self._invalidate_caches()
         self._cross_section_data = cross_section_data
         for xs in cross_section_data:
             xs = CrossSection(xs)
@@ -103,10 +105,13 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
             topo_id = xs.topo_id
             self._cross_section_map[(location_id, chainage, topo_id)] = xs
 
-    def _init_from_xns11(self, file_name: str | Path):
-        """Initialize the collection from an Xns11 file."""
+    def _init_from_xns11(self, file_name: str | Path, check_exists: bool = True):
+        """Initialize the collection from an Xns11 file.
+
+        The existence check can be skipped by callers that have already made it.
+        """
         file_name = self._validate_file_name(file_name)
-        if not file_name.exists():
+        if check_exists and not file_name.exists():
             raise FileNotFoundError(f"File not found: {file_name}")
         connection = Connection.Create(str(file_name))
         self._cross_section_data = self._cross_section_data_factory.Open(
@@ -123,6 +128,10 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
             raise ValueError(f"File must have extension .xns11, not {file_name.suffix}")
         return file_name
 
+    def _invalidate_caches(self):
+        """Clear data derived from the cross sections. Called whenever the collection changes."""
+        self._dataframe_cache = None
+
     def __repr__(self) -> str:
         """Return a string representation of the collection."""
         return f"<mikeio1d.{type(self).__name__} ({len(self)})>"
@@ -170,6 +179,7 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
     def __setitem__(self, key: Tuple[LocationId, Chainage, TopoId], value: CrossSection):
         """Set a cross section in the collection."""
         key = self._validate_key_value_pair(key, value)
+        self._invalidate_caches()
         if key in self._cross_section_map:
             del self[key]
         self._cross_section_data.Add(value._m1d_cross_section)
@@ -204,6 +214,7 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
     def __delitem__(self, key: Tuple[LocationId, Chainage, TopoId]):
         """Delete a cross section from the collection."""
         key = self._validate_key(key)
+        self._invalidate_caches()
         xs = self.get(key)
         if xs is not None:
             deleted = self._cross_section_data.RemoveCrossSection(xs.location, xs.topo_id)
@@ -335,20 +346,23 @@ class CrossSectionCollection(MutableMapping[Tuple[LocationId, Chainage, TopoId],
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert the collection to a DataFrame."""
-        location_ids = [k[0] for k in self.keys()]
-        chainages = [k[1] for k in self.keys()]
-        topo_ids = [k[2] for k in self.keys()]
-
-        df = pd.DataFrame(
-            {
-                "location_id": location_ids,
-                "chainage": chainages,
-                "topo_id": topo_ids,
-                "cross_section": list(self.values()),
-            }
-        )
-        df = df.set_index(["location_id", "chainage", "topo_id"])
-        return df
+        if self._dataframe_cache is None:
+            location_ids = [k[0] for k in self.keys()]
+            chainages = [k[1] for k in self.keys()]
+            topo_ids = [k[2] for k in self.keys()]
+
+            df = pd.DataFrame(
+                {
+                    "location_id": location_ids,
+                    "chainage": chainages,
+                    "topo_id": topo_ids,
+                    "cross_section": list(self.values()),
+                }
+            )
+            self._dataframe_cache = df.set_index(["location_id", "chainage", "topo_id"])
+
+        # Return a copy, so that changes to the returned frame do not leak into the cache.
+        return self._dataframe_cache.copy()
 
     def to_geopandas(self, mode: str = "sections") -> gpd.GeoDataFrame:
         """Convert the collection to a GeoDataFrame.
@@ -154,12 +154,14 @@ def _to_dotnet_float_array(x):
     return to_dotnet_array(x.astype(np.float32))
 
 
-def to_numpy(src):
+def to_numpy(src, dtype=None):
     """Convert .NET array to numpy array.
 
     Parameters
     ----------
     src : System.Array
+    dtype : data-type, optional
+        Data type of the returned array. The float32 data of src is kept if None.
 
     Returns
     -------
@@ -171,7 +173,8 @@ def to_numpy(src):
         src_ptr = src_hndl.AddrOfPinnedObject().ToInt64()
         bufType = ctypes.c_float * len(src)
         cbuf = bufType.from_address(src_ptr)
-        d = np.frombuffer(cbuf, dtype=cbuf._type_)
+        # Copy while the array is still pinned, the GC may move it once the handle is freed.
+        d = np.array(np.frombuffer(cbuf, dtype=cbuf._type_), dtype=dtype)
     finally:
         if src_hndl.IsAllocated:
             src_hndl.Free()
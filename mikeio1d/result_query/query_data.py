@@ -12,6 +12,7 @@ from abc import abstractmethod
 
 import numpy as np
 
+from ..dotnet import to_numpy
 from ..custom_exceptions import NoDataForQuery
 from ..custom_exceptions import InvalidQuantity
 from ..various import NAME_DELIMITER
@@ -60,7 +61,7 @@ class QueryData(ABC):
     @staticmethod
     def from_dotnet_to_python(array):
         """Convert .NET array to numpy."""
-        return np.fromiter(array, np.float64)
+        return to_numpy(array, dtype=np.float64)
 
     @property
     def quantity(self):
@@ -148,6 +148,8 @@ class ResultReader(ABC):
         if not self._loaded:
             self._load_file()
             self._loaded = True
+            # The time steps of the loaded data replace any previously cached time index.
+            self._time_index = None
 
     # endregion File loading
 
@@ -259,6 +261,30 @@ class ResultReader(ABC):
         postfix = f"{chainage:g}" if self.put_chainage_in_col_name else str(i)
         return self.col_name_delimiter.join([quantity_id, name, postfix])
 
+    def get_column_names(self, data_set, data_item):
+        """Get the column names for all elements of a data item.
+
+        Equivalent to calling get_column_name for every element index, but the parts
+        shared by all elements are only evaluated once.
+        """
+        quantity_id = data_item.Quantity.Id
+        number_of_elements = data_item.NumberOfElements
+        name = self.get_data_set_name(data_set, data_item.ItemId)
+
+        if name == "":
+            return [quantity_id] * number_of_elements
+
+        prefix = self.col_name_delimiter.join([quantity_id, name])
+        if data_item.IndexList is None:
+            return [prefix] * number_of_elements
+
+        prefix += self.col_name_delimiter
+        if not self.put_chainage_in_col_name:
+            return [f"{prefix}{i}" for i in range(number_of_elements)]
+
+        chainages = data_set.GetChainages(data_item)
+        return [f"{prefix}{chainages[i]:g}" for i in range(number_of_elements)]
+
     # region Methods for LTS result files
 
     def update_time_quantities(self, df: pd.DataFrame):
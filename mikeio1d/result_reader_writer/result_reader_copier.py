@@ -5,11 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
     from typing import List
     from typing import Tuple
     from typing import Set
     from typing import Optional
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
@@ -26,6 +29,48 @@ from DHI.Mike1D.MikeIO import ResultDataCopier
 from DHI.Mike1D.MikeIO import DataEntry as DataEntryNet
 
 
+def create_data_entries(
+    result_data_copier: ResultDataCopier,
+    data_items: List[tuple],
+    get_column_names: Callable[..., list],
+) -> Tuple[DataEntryNet, list]:
+    """Create data entries for all elements of the given data items, with a column name for each.
+
+    Parameters
+    ----------
+    result_data_copier : ResultDataCopier
+        Copier used to create the list of data entries.
+    data_items : list of tuple
+        Pairs of IDataSet and IDataItem objects to create data entries for.
+    get_column_names : callable
+        Called with an IDataSet and IDataItem, returning the column names of all its elements.
+
+    Returns
+    -------
+    tuple
+        The list of data entries and the list of their column names.
+
+    """
+    data_entries = result_data_copier.GetEmptyDataEntriesList()
+    column_names = []
+    for data_set, data_item in data_items:
+        for i in range(data_item.NumberOfElements):
+            data_entries.Add(DataEntryNet(data_item, i))
+        column_names.extend(get_column_names(data_set, data_item))
+
+    return data_entries, column_names
+
+
+def copy_data(
+    result_data_copier: ResultDataCopier, data_entries, number_of_timesteps: int
+) -> np.ndarray:
+    """Copy the time series of the data entries into the columns of a new float32 array."""
+    shape = (number_of_timesteps, len(data_entries))
+    data_array = np.zeros(shape, dtype=np.dtype("float32"), order="F")
+    result_data_copier.CopyData(IntPtr(data_array.ctypes.data), data_entries)
+    return data_array
+
+
 class ResultReaderCopier(ResultReader):
     """Class for reading the ResultData object TimeData into Pandas data frame using ResultDataCopier object from DHI.Mike1D.MikeIO library."""
 
@@ -97,16 +142,17 @@ class ResultReaderCopier(ResultReader):
         if number_of_items == 0:
             raise ValueError("Could not create DataFrame with zero items")
 
-        shape = (number_of_timesteps, number_of_items)
-        data_array = np.zeros(shape, dtype=np.dtype("float32"), order="F")
-
-        data_pointer = data_array.ctypes.data
-        data_pointer_net = IntPtr(data_pointer)
-        self.result_data_copier.CopyData(data_pointer_net, data_entries)
+        # pythonnet releases the GIL while CopyData runs, so the column and time indices
+        # can be built on this thread while the data is being copied.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            copy_data_future = executor.submit(
+                copy_data, self.result_data_copier, data_entries, number_of_timesteps
+            )
+            columns = self.create_column_index(timeseries_ids, column_mode=column_mode)
+            time_index = self.time_index
+            data_array = copy_data_future.result()
 
-        columns = self.create_column_index(timeseries_ids, column_mode=column_mode)
-
-        df = pd.DataFrame(data_array, index=self.time_index, columns=columns)
+        df = pd.DataFrame(data_array, index=time_index, columns=columns)
 
         self.update_time_quantities(df)
 
@@ -137,9 +183,7 @@ class ResultReaderCopier(ResultReader):
 
     def get_all_data_entries_and_timeseries_ids(self) -> Tuple[DataEntryNet, List[TimeSeriesId]]:
         """Get all data entries and TimeSeriesIds from the ResultData object."""
-        data_entries = self.result_data_copier.GetEmptyDataEntriesList()
-        timeseries_ids: List[TimeSeriesId] = []
-        timeseries_ids_set = set()
+        included_data_items = []
         for data_set in self.data.DataSets:
             data_set = impl(data_set)
 
@@ -147,16 +191,17 @@ class ResultReaderCopier(ResultReader):
                 if not self.res1d.filter.is_data_item_included(data_item):
                     continue
                 data_item = impl(data_item)
-                for i in range(data_item.NumberOfElements):
-                    data_entry = DataEntryNet(data_item, i)
-                    data_entries.Add(data_entry)
+                included_data_items.append((data_set, data_item))
+
+        timeseries_ids_set = set()
 
-                    timeseries_id = self.get_unique_timeseries_id(
-                        timeseries_ids_set, data_set, data_item, i
-                    )
-                    timeseries_ids.append(timeseries_id)
+        def get_timeseries_ids(data_set, data_item) -> List[TimeSeriesId]:
+            return [
+                self.get_unique_timeseries_id(timeseries_ids_set, data_set, data_item, i)
+                for i in range(data_item.NumberOfElements)
+            ]
 
-        return data_entries, timeseries_ids
+        return create_data_entries(self.result_data_copier, included_data_items, get_timeseries_ids)
 
     def get_unique_timeseries_id(
         self,
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Dict
     from .result_reader import ResultReader
     from ..filter import ResultFilter
 
@@ -35,12 +34,12 @@ class ResultReaderCreator:
         filter: ResultFilter = None,
     ) -> ResultReader:
         """Create a ResultReader object based on the provided type."""
-        reasult_readers: Dict[ResultReaderType, ResultReader] = {
-            ResultReaderType.COPIER: ResultReaderCopier,
-            ResultReaderType.QUERY: ResultReaderQuery,
-        }
-
-        reader = reasult_readers.get(result_reader_type, None)
+        if result_reader_type == ResultReaderType.COPIER:
+            reader = ResultReaderCopier
+        elif result_reader_type == ResultReaderType.QUERY:
+            reader = ResultReaderQuery
+        else:
+            raise ValueError(f"Unknown result_reader_type: {result_reader_type}")
 
         return reader(
             res1d=res1d,
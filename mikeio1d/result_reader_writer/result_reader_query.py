@@ -13,12 +13,18 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..query import QueryData
 
 
+import numpy as np
 import pandas as pd
 
 from ..dotnet import pythonnet_implementation as impl
+from ..dotnet import to_numpy
 from .result_reader import ResultReader
 from ..quantities import TimeSeriesId
 from ..result_query import QueryDataCreator
+from .result_reader_copier import copy_data
+from .result_reader_copier import create_data_entries
+
+from DHI.Mike1D.MikeIO import ResultDataCopier
 
 
 class ResultReaderQuery(ResultReader):
@@ -35,16 +41,15 @@ class ResultReaderQuery(ResultReader):
                 f"ResultReaderQuery does not support column_mode {column_mode}."
             )
         queries = [QueryDataCreator.from_timeseries_id(t) for t in timeseries_ids]
+        col_names = [str(query) for query in queries]
 
-        dfs = []
-        for query in queries:
-            df = pd.DataFrame(index=self.time_index)
-            values = query.get_values(self.res1d)
-            df[str(query)] = values
-            dfs.append(df)
+        time_index = self.time_index
+        shape = (len(time_index), len(queries))
+        data_array = np.empty(shape, dtype=np.dtype("float32"), order="F")
+        for j, query in enumerate(queries):
+            data_array[:, j] = query.get_values(self.res1d)
 
-        df = pd.concat(dfs, axis=1)
-        df = df.astype("float32")
+        df = pd.DataFrame(data_array, index=time_index, columns=col_names)
         self.update_time_quantities(df)
 
         return df
@@ -58,28 +63,31 @@ class ResultReaderQuery(ResultReader):
                 f"ResultReaderQuery does not support column_mode {column_mode}."
             )
 
-        dfs = []
+        included_data_items = []
         for data_set in self.data.DataSets:
             data_set = impl(data_set)
             if not self.is_data_set_included(data_set):
                 continue
 
             for data_item in data_set.DataItems:
-                values_name_pair = self.get_values(data_set, data_item)
-                for values, col_name in values_name_pair:
-                    df = pd.DataFrame(index=self.time_index)
-                    df[col_name] = values
-                    dfs.append(df)
-
-        df = pd.concat(dfs, axis=1)
-        df = df.astype("float32")
+                included_data_items.append((data_set, data_item))
+
+        result_data_copier = ResultDataCopier(self.data)
+        data_entries, col_names = create_data_entries(
+            result_data_copier, included_data_items, self.get_column_names
+        )
+        data_array = copy_data(result_data_copier, data_entries, self.data.NumberOfTimeSteps)
+
+        df = pd.DataFrame(data_array, index=self.time_index, columns=col_names)
         self.update_time_quantities(df)
+
         return df
 
     def get_values(self, data_set, data_item):
         """Get all time series values in given data_item."""
         self.load_dynamic_data()
 
-        for i in range(data_item.NumberOfElements):
-            col_name = self.get_column_name(data_set, data_item, i)
-            yield data_item.CreateTimeSeriesData(i), col_name
+        col_names = self.get_column_names(data_set, data_item)
+        for i, col_name in enumerate(col_names):
+            values = to_numpy(data_item.CreateTimeSeriesData(i))
+            yield values, col_name
@@ -41,17 +41,33 @@ class ResultWriter:
         except ValueError:
             raise ValueError("The dataframe columns must be TimeSeriesId compatible multiindex.")
 
-        for header, series in dataframe.items():
-            timeseries_id = TimeSeriesId.try_from_obj(header)
-            data_entry = timeseries_id.to_data_entry(self.res1d)
+        # Resolve all headers up front, so the per-column loop only writes values.
+        data_entries = [
+            TimeSeriesId.try_from_obj(header).to_data_entry(self.res1d)
+            for header in dataframe.columns
+        ]
+
+        # Column-major layout makes every column a contiguous slice. Frames created by
+        # ResultReaderCopier already have this layout, in which case no copy is made.
+        values_array = np.asfortranarray(dataframe.to_numpy())
+
+        # Several columns typically share a data item, so only ask .NET once per data item.
+        number_of_time_steps_cache = {}
+
+        time_index = dataframe.index
+        for j, data_entry in enumerate(data_entries):
+            values = values_array[:, j]
             data_item = data_entry.data_item
             element_index = data_entry.element_index
 
-            values = series.to_numpy()
-            time_index = series.index
-            self.set_values(time_index, values, data_item, element_index)
+            number_of_time_steps = number_of_time_steps_cache.get(id(data_item))
+            if number_of_time_steps is None:
+                number_of_time_steps = data_item.TimeData.NumberOfTimeSteps
+                number_of_time_steps_cache[id(data_item)] = number_of_time_steps
 
-    def set_values(self, time_index, values, data_item, element_index):
+            self.set_values(time_index, values, data_item, element_index, number_of_time_steps)
+
+    def set_values(self, time_index, values, data_item, element_index, number_of_time_steps=None):
         """Modify the TimeData value of the data item for given element index.
 
         Parameters
@@ -64,9 +80,14 @@ class ResultWriter:
             MIKE 1D IDataItem object.
         element_index : int
             Element index into data item.
+        number_of_time_steps : int, optional
+            Number of time steps in TimeData of the data item. Queried from the data item if None.
 
         """
-        if len(values) == data_item.TimeData.NumberOfTimeSteps:
+        if number_of_time_steps is None:
+            number_of_time_steps = data_item.TimeData.NumberOfTimeSteps
+
+        if len(values) == number_of_time_steps:
             self.set_values_all(values, data_item, element_index)
         else:
             self.set_values_indexed(time_index, values, data_item, element_index)
@@ -78,9 +99,14 @@ class ResultWriter:
         values_count = len(values)
         is_float = not isinstance(values[0] if values_count > 0 else 0.0, np.ndarray)
 
-        for i in range(values_count):
-            value = float(values[i] if is_float else values[i][0])
-            data_item.TimeData.SetValue(i, element_index, value)
+        if is_float:
+            values = np.asarray(values, dtype=np.float64).ravel()
+        else:
+            values = np.asarray([v[0] for v in values], dtype=np.float64)
+
+        time_data = data_item.TimeData
+        for i, value in enumerate(values.tolist()):
+            time_data.SetValue(i, element_index, value)
 
     def set_values_indexed(self, time_index, values, data_item, element_index):
         """Set only the provided for time_index and values in TimeData of the data item for given element index."""
@@ -93,10 +119,17 @@ class ResultWriter:
 
         self._validate_time_index_values_pair(time_index, values)
 
+        # Look up all time steps before writing anything, so that an unknown time stamp
+        # does not leave TimeData partially modified.
+        timestep_indices = res1d_time_index.get_indexer(time_index)
+        is_missing = timestep_indices == -1
+        if is_missing.any():
+            missing_times = list(time_index[is_missing])
+            raise KeyError(f"Time stamps not found in the result file: {missing_times}")
+
         for i in range(len(values)):
-            time = time_index[i]
             value = float(values[i])
-            timestep_index = res1d_time_index.get_loc(time)
+            timestep_index = int(timestep_indices[i])
             data_item.TimeData.SetValue(timestep_index, element_index, value)
 
     def _validate_time_index_values_pair(self, time_index, values):
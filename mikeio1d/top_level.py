@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from .res1d import Res1D
@@ -37,16 +38,31 @@ def open(file_name: str | Path, **kwargs) -> Res1D | Xns11:
     >>> xs = mikeio1d.open("cross_section.xns11")
     >>> xs
     """
-    if isinstance(file_name, str):
-        file_name = Path(file_name)
+    file_name = _resolve_existing(file_name)
 
-    if not file_name.exists():
+    suffix = file_name.suffix.lower()
+    opener = _openers().get(suffix)
+    if opener is None:
+        raise ValueError(f"Unsupported file extension: {suffix}")
+
+    if opener is Xns11 and not kwargs:
+        # The file is known to exist, so Xns11 does not need to check again.
+        return Xns11._from_path(file_name, check_exists=False)
+
+    return opener(str(file_name), **kwargs)
+
+
+def _resolve_existing(file_name: str | Path) -> Path:
+    """Convert file_name to a Path, raising FileNotFoundError if it is not an existing file."""
+    file_name = Path(file_name)
+    if not file_name.is_file():
         raise FileNotFoundError(f"File not found: {file_name}")
+    return file_name
 
-    suffix = file_name.suffix.lower()
-    file_name = str(file_name)
 
-    if suffix in Res1D.get_supported_file_extensions():
-        return Res1D(file_name, **kwargs)
-    elif suffix in Xns11.get_supported_file_extensions():
-        return Xns11(file_name, **kwargs)
+@functools.lru_cache(maxsize=1)
+def _openers() -> dict[str, type]:
+    """Map supported file extensions to the class opening them."""
+    openers = {ext: Res1D for ext in Res1D.get_supported_file_extensions()}
+    openers.update({ext: Xns11 for ext in Xns11.get_supported_file_extensions()})
+    return openers
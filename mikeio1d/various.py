@@ -7,15 +7,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import Type
 
-import clr
+import functools
 import warnings
 import sys
 
 from collections.abc import Iterable
 
-from System import Enum
-from DHI.Mike1D.Generic import PredefinedQuantity
-
 NAME_DELIMITER = ":"
 DELETE_VALUE = -1e-30
 
@@ -25,7 +22,18 @@ def mike1d_quantities():
 
     Useful for knowing what quantity string to query.
     """
-    return [quantity for quantity in Enum.GetNames(clr.GetClrType(PredefinedQuantity))]
+    return list(_mike1d_quantities())
+
+
+@functools.lru_cache(maxsize=1)
+def _mike1d_quantities() -> tuple[str, ...]:
+    """Predefined Mike1D quantities, only reflected from .NET on the first call."""
+    # Imported here so that importing this module does not require the .NET runtime.
+    import clr
+    from System import Enum
+    from DHI.Mike1D.Generic import PredefinedQuantity
+
+    return tuple(Enum.GetNames(clr.GetClrType(PredefinedQuantity)))
 
 
 def try_import_geopandas():
@@ -79,6 +87,14 @@ def make_list_if_not_iterable(obj) -> list:
     if obj is None:
         return []
 
+    # Check the common concrete types first, isinstance against the Iterable ABC is slower.
+    obj_type = type(obj)
+    if obj_type is list or obj_type is tuple:
+        return obj
+
+    if obj_type is str:
+        return [obj]
+
     if not isinstance(obj, Iterable):
         return [obj]
 
@@ -2,15 +2,46 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict, namedtuple
+from functools import cached_property
 from pathlib import Path
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 from DHI.Mike1D.Generic import Location
 
 from .cross_sections import CrossSection
 from .cross_sections import CrossSectionCollection
+from .cross_sections.cross_section import _point_coordinates
+
+
+_PointInfo = namedtuple("PointInfo", ["index", "value"])
+
+
+class _Point:
+    """A point found by a query, described by its chainage, reach, topo-id and cross section.
+
+    Each component is a plain (index, value) tuple. They are only wrapped in _PointInfo
+    objects when handed out through the deprecated _find_points.
+    """
+
+    __slots__ = ("chainage", "reach", "topoid", "xsection")
+
+    def __init__(self, chainage, reach, topoid, xsection=None):
+        self.chainage = chainage
+        self.reach = reach
+        self.topoid = topoid
+        self.xsection = xsection
+
+
+def _deprecate(message: str):
+    """Warn about a deprecated feature at the line of code that uses it.
+
+    The warning filters decide how often it is shown. By default, once per line of code.
+    """
+    warn(message, stacklevel=3)
 
 
 class Xns11(CrossSectionCollection):
@@ -50,6 +81,8 @@ class Xns11(CrossSectionCollection):
 
     """
 
+    _CACHED_PROPERTIES = ("_topoids", "topoid_names", "_reaches", "reach_names")
+
     def __init__(self, file_path: str | Path = None, *args, **kwargs):
         if file_path and not isinstance(file_path, (str, Path)):
             self._file_path = None
@@ -73,10 +106,36 @@ class Xns11(CrossSectionCollection):
     @staticmethod
     def from_cross_section_collection(xsections: CrossSectionCollection) -> Xns11:
         """Create a Xns11 object from a CrossSectionCollection."""
-        xns = Xns11()
+        xns = Xns11._empty()
         xns._init_from_cross_section_data(xsections._cross_section_data)
         return xns
 
+    @classmethod
+    def _empty(cls) -> Xns11:
+        """Create an empty Xns11 object, without dispatching on constructor arguments."""
+        xns = cls.__new__(cls)
+        xns._file_path = None
+        CrossSectionCollection.__init__(xns)
+        return xns
+
+    @classmethod
+    def _from_path(cls, file_path: Path, check_exists: bool = True) -> Xns11:
+        """Create a Xns11 object from a file path that is already a Path."""
+        xns = cls._empty()
+        xns._file_path = file_path
+        xns._init_from_xns11(file_path, check_exists=check_exists)
+        return xns
+
+    def _invalidate_caches(self):
+        """Clear lookup tables derived from the cross section data."""
+        super()._invalidate_caches()
+        self._reaches_cache = None
+        self._chainages_cache = {}
+        self._cross_sections_cache = {}
+        self._closest_cross_section_cache = {}
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     @property
     def file_path(self) -> Path | None:
         """Full path and file name to the xns11 file."""
@@ -84,13 +143,13 @@ class Xns11(CrossSectionCollection):
 
     def info(self):
         """Print information about the file."""
-        warn("The 'info' method is deprecated. Use 'print(xns)' instead.")
+        _deprecate("The 'info' method is deprecated. Use 'print(xns)' instead.")
         info = self._get_info()
         print(info)
 
     def _get_info(self) -> str:
         info = []
-        info.append(f"# Cross sections: {str(len(self.xsections))}")
+        info.append(f"# Cross sections: {len(self)}")
         info.append(f"Interpolation type: {str(self.interpolation_type)}")
         info = str.join("\n", info)
         return info
@@ -133,18 +192,20 @@ class Xns11(CrossSectionCollection):
         #### Get all cross sections for a particular location and topo.
         >>> xns.xsection[location_id, ..., topo_id]
         """
-        warn("The 'xsections' property is deprecated. You can now use Xns11 directly.")
+        _deprecate("The 'xsections' property is deprecated. You can now use Xns11 directly.")
         return self
 
     @property
     def file(self):
         """Alias for CrossSectionData objected stored on the member '_cross_section_data'."""
-        warn("The 'file' property is deprecated. Use '_cross_section_data' instead.")
+        _deprecate("The 'file' property is deprecated. Use '_cross_section_data' instead.")
         return self._cross_section_data
 
     def __enter__(self):
         """Context manager enter method."""
-        warn("Using Xns11 as a context manager is deprecated. Files are automatically closed.")
+        _deprecate(
+            "Using Xns11 as a context manager is deprecated. Files are automatically closed."
+        )
         return self
 
     def __exit__(self, *excinfo):
@@ -153,119 +214,252 @@ class Xns11(CrossSectionCollection):
 
     def close(self):
         """Close the file handle."""
-        warn("The 'close' method is deprecated. Files are automatically closed.")
-        self.__del__()
-
-    @property
+        _deprecate("The 'close' method is deprecated. Files are automatically closed.")
+        # The file itself is not held open, but lookup tables referencing .NET objects can be freed.
+        self._invalidate_caches()
+
+    def _build_reach_index(self):
+        """Build lookup tables over the reaches of the cross section data, if not already built.
+
+        The reaches are enumerated from .NET once and stored as parallel tuples of
+        reach objects, reach IDs and topo IDs, together with a (reach ID, topo ID) index
+        and the topo IDs found for each reach ID with the position of each topo ID in that list.
+        The reach indices of each topo ID are indexed as well, and the sets of reach IDs and
+        topo IDs are kept for membership tests.
+        """
+        if self._reaches_cache is not None:
+            return
+
+        reaches, reach_ids, topo_ids = [], [], []
+        self._reach_by_key = {}
+        self._topoids_in_reach_cache = defaultdict(list)
+        self._topoid_position_in_reach = {}
+        self._reach_indices_by_topoid = defaultdict(list)
+        # Stream the .NET enumerable once, reading each ID a single time.
+        for reach_idx, reach in enumerate(self._cross_section_data.GetReachTopoIdEnumerable()):
+            reach_id, topo_id = reach.ReachId, reach.TopoId
+            reaches.append(reach)
+            reach_ids.append(reach_id)
+            topo_ids.append(topo_id)
+            key = (reach_id, topo_id)
+            self._reach_by_key.setdefault(key, (reach_idx, reach))
+            topoids_in_reach = self._topoids_in_reach_cache[reach_id]
+            self._topoid_position_in_reach.setdefault(key, len(topoids_in_reach))
+            topoids_in_reach.append(topo_id)
+            self._reach_indices_by_topoid[topo_id].append(reach_idx)
+        self._reach_ids = tuple(reach_ids)
+        self._topo_ids = tuple(topo_ids)
+        self._reach_id_set = frozenset(reach_ids)
+        self._topo_id_set = frozenset(topo_ids)
+        self._reaches_cache = tuple(reaches)
+
+    def _cached_chainages(self, reach_idx: int) -> tuple[list[float], list]:
+        """Return the sorted chainages of the reach at the given index and their cross sections.
+
+        Both lists are read from .NET on first use and cached in _chainages_cache and
+        _cross_sections_cache.
+        """
+        chainages = self._chainages_cache.get(reach_idx)
+        if chainages is None:
+            reach = self._reaches_cache[reach_idx]
+            chainages, cross_sections = [], []
+            for chainage_and_cross_section in reach.GetChainageSortedCrossSections():
+                chainages.append(chainage_and_cross_section.Key)
+                cross_sections.append(chainage_and_cross_section.Value)
+            self._chainages_cache[reach_idx] = chainages
+            self._cross_sections_cache[reach_idx] = cross_sections
+        return chainages, self._cross_sections_cache[reach_idx]
+
+    def _find_chainage_index(
+        self, reach_idx: int, chainage: float, chainage_tolerance: float
+    ) -> int | None:
+        """Index of the first chainage of a reach within the tolerance, or None if there is none."""
+        chainages, _ = self._cached_chainages(reach_idx)
+        idx = bisect_right(chainages, chainage - chainage_tolerance)
+        if idx < len(chainages) and abs(chainages[idx] - chainage) < chainage_tolerance:
+            return idx
+        return None
+
+    def _find_nearest_chainage_index(self, reach_idx: int, chainage: float, first_idx: int) -> int:
+        """Return the index of the chainage of a reach nearest to the given chainage.
+
+        The search starts at first_idx, the index of the first chainage within the tolerance.
+        The chainages are sorted, so the nearest one is found by walking forward from there.
+        """
+        chainages, _ = self._cached_chainages(reach_idx)
+        nearest_idx = first_idx
+        nearest_distance = abs(chainages[first_idx] - chainage)
+        for idx in range(first_idx + 1, len(chainages)):
+            distance = abs(chainages[idx] - chainage)
+            if distance >= nearest_distance:
+                break
+            nearest_idx, nearest_distance = idx, distance
+        return nearest_idx
+
+    @cached_property
     def _topoids(self):
-        warn("The '_topoids' method is deprecated. Use '.xsections' instead.")
-        return list(self._cross_section_data.GetReachTopoIdEnumerable())
+        _deprecate("The '_topoids' method is deprecated. Use '.xsections' instead.")
+        self._build_reach_index()
+        return self._reaches_cache
 
-    @property
+    @cached_property
     def topoid_names(self):
-        """A list of the topo-id names."""
-        warn("The 'topoid_names' method is deprecated. Use '.xsections.topo_ids' instead.")
-        return [topoid.TopoId for topoid in self._topoids]
+        """A tuple of the topo-id names."""
+        _deprecate("The 'topoid_names' method is deprecated. Use '.xsections.topo_ids' instead.")
+        self._build_reach_index()
+        return self._topo_ids
 
-    @property
+    @cached_property
     def _reaches(self):
-        warn("The '_reaches' method is deprecated. Use '.xsections' instead.")
-        return list(self._cross_section_data.GetReachTopoIdEnumerable())
+        _deprecate("The '_reaches' method is deprecated. Use '.xsections' instead.")
+        self._build_reach_index()
+        return self._reaches_cache
 
-    @property
+    @cached_property
     def reach_names(self):
-        """A list of the reach names."""
-        warn("The 'reach_names' method is deprecated. Use '.xsections.location_ids' instead.")
-        return [reach.ReachId for reach in self._topoids]
+        """A tuple of the reach names."""
+        _deprecate("The 'reach_names' method is deprecated. Use '.xsections.location_ids' instead.")
+        self._build_reach_index()
+        return self._reach_ids
 
-    @staticmethod
     def _topoid_in_reach(self, reach):
         """List topo-IDs contained in a reach."""
-        warn("The '_topoid_in_reach' method is deprecated.")
-        return [
-            r.TopoId
-            for r in list(self.file.GetReachTopoIdEnumerable())
-            if reach.ReachId == r.ReachId
-        ]
+        _deprecate("The '_topoid_in_reach' method is deprecated.")
+        self._build_reach_index()
+        return list(self._topoids_in_reach_cache.get(reach.ReachId, []))
 
-    @staticmethod
-    def _chainages(reach):
+    def _chainages(self, reach):
         """List chainages of a reach topo-ID combination."""
-        warn("The '_chainages' method is deprecated.")
-        return [r.Key for r in list(reach.GetChainageSortedCrossSections())]
+        _deprecate("The '_chainages' method is deprecated.")
+        self._build_reach_index()
+        reach_entry = self._reach_by_key.get((reach.ReachId, reach.TopoId))
+        if reach_entry is None:
+            return [r.Key for r in list(reach.GetChainageSortedCrossSections())]
+        reach_idx, _ = reach_entry
+        chainages, _ = self._cached_chainages(reach_idx)
+        return list(chainages)
 
     def _get_values(self, points):
-        warn("The '_get_values' method is deprecated. Use '.xsections' instead.")
-        df = pd.DataFrame()
-        p = zip(points["chainage"], points["reach"], points["topoid"])
-        for chainage, reach, topoid in p:
-            location = Location()
-            location.ID = reach.value
-            location.Chainage = chainage.value
-            geometry = self._cross_section_data.FindClosestCrossSection(
-                location, topoid.value
-            ).BaseCrossSection.Points
-            x, z = [], []
-            for i in range(geometry.Count):
-                x.append(geometry.LstPoints[i].X)
-                z.append(geometry.LstPoints[i].Z)
-            x_name = f"x {topoid.value} {reach.value} {chainage.value}"
-            z_name = f"z {topoid.value} {reach.value} {chainage.value}"
-            geometry_x = pd.Series(x, name=x_name)
-            geometry_z = pd.Series(z, name=z_name)
-            df = pd.concat([df, geometry_x, geometry_z], axis=1)
-        return df
+        _deprecate("The '_get_values' method is deprecated. Use '.xsections' instead.")
+        # Points found by _find_points already refer to their cross section.
+        xsections = points.get("xsection") or [None] * len(points["chainage"])
+        p = zip(points["chainage"], points["reach"], points["topoid"], xsections)
+        points_list = []
+        for chainage, reach, topoid, xsection in p:
+            point = _Point(
+                (chainage.index, chainage.value),
+                (reach.index, reach.value),
+                (topoid.index, topoid.value),
+                (xsection.index, xsection.value) if xsection is not None else None,
+            )
+            points_list.append(point)
+        return self._get_point_values(points_list)
+
+    def _get_point_values(self, points: list[_Point], legacy_columns=True) -> pd.DataFrame:
+        """Read the x and z coordinates of the cross sections at the given points."""
+        column_names = []
+        coordinate_arrays = []
+        # Only used for points that do not already refer to their cross section.
+        location = None
+        # Coordinates of points that are requested more than once are only read once per call.
+        # They are not kept between calls, as the points of a cross section can be edited in place.
+        coordinates_cache = {}
+        for point in points:
+            chainage_value = point.chainage[1]
+            reach_name = point.reach[1]
+            topoid_name = point.topoid[1]
+            cache_key = (topoid_name, reach_name, chainage_value)
+            coordinates = coordinates_cache.get(cache_key)
+            if coordinates is None:
+                if point.xsection is not None:
+                    m1d_xsection = point.xsection[1]
+                else:
+                    m1d_xsection = self._closest_cross_section_cache.get(cache_key)
+                if m1d_xsection is None:
+                    if location is None:
+                        location = Location()
+                    location.ID = reach_name
+                    location.Chainage = chainage_value
+                    m1d_xsection = self._cross_section_data.FindClosestCrossSection(
+                        location, topoid_name
+                    )
+                    self._closest_cross_section_cache[cache_key] = m1d_xsection
+                geometry = m1d_xsection.BaseCrossSection.Points
+                coordinates = _point_coordinates(geometry)
+                coordinates_cache[cache_key] = coordinates
+            x, z = coordinates
+            if legacy_columns:
+                name_suffix = f"{topoid_name} {reach_name} {chainage_value}"
+                x_name = f"x {name_suffix}"
+                z_name = f"z {name_suffix}"
+            else:
+                x_name = ("x", topoid_name, reach_name, chainage_value)
+                z_name = ("z", topoid_name, reach_name, chainage_value)
+            column_names += [x_name, z_name]
+            coordinate_arrays += [x, z]
+
+        # Fill all columns into one array, padding cross sections with fewer points with NaN.
+        number_of_rows = max((len(array) for array in coordinate_arrays), default=0)
+        values = np.full((number_of_rows, len(coordinate_arrays)), np.nan)
+        for i, array in enumerate(coordinate_arrays):
+            values[: len(array), i] = array
+
+        if legacy_columns:
+            columns = pd.Index(column_names)
+        else:
+            columns = pd.MultiIndex.from_tuples(
+                column_names, names=["coordinate", "topoid_name", "reach_name", "chainage"]
+            )
+        return pd.DataFrame(values, columns=columns)
 
     def _get_data(self, points):
-        warn("The '_get_data' method is deprecated. Use '.xsections' instead.")
+        _deprecate("The '_get_data' method is deprecated. Use '.xsections' instead.")
         df = self._get_values(points)
         return df
 
+    def _validate_query(self, q, chainage_tolerance=0.1) -> tuple[int | None, int | None]:
+        """Check whether a query points to existing data in the file.
+
+        Returns the index of the queried reach and the index of the queried chainage in that reach,
+        each None if the query does not specify it.
+        """
+        if q.topoid_name not in self._topo_id_set:
+            raise ValueError(f"Topo-id '{q.topoid_name}' was not found.")
+        if q.reach_name is None:
+            return None, None
+        if q.reach_name not in self._reach_id_set:
+            raise ValueError(f"Reach '{q.reach_name}' was not found.")
+        # Raise an error if the combination reach and topo-id does not exist
+        reach_entry = self._reach_by_key.get((q.reach_name, q.topoid_name))
+        if reach_entry is None:
+            raise ValueError(f"Topo-ID '{q.topoid_name}' was not found in reach '{q.reach_name}'.")
+        reach_idx, _ = reach_entry
+        chainage_idx = None
+        if q.chainage is not None:
+            chainage_idx = self._find_chainage_index(reach_idx, q.chainage, chainage_tolerance)
+            if chainage_idx is None:
+                raise ValueError(
+                    f"Chainage {q.chainage} was not found in reach '{q.reach_name}' for Topo-ID '{q.topoid_name}'."
+                )
+        return reach_idx, chainage_idx
+
     def _validate_queries(self, queries, chainage_tolerance=0.1):
         """Check whether the queries point to existing data in the file."""
-        warn("The '_validate_queries' method is deprecated. Use '.xsections' instead.")
+        _deprecate("The '_validate_queries' method is deprecated. Use '.xsections' instead.")
+        self._build_reach_index()
         for q in queries:
-            if q.topoid_name not in self.topoid_names:
-                raise ValueError(f"Topo-id '{q.topoid_name}' was not found.")
-            if q.reach_name is not None:
-                if q.reach_name not in self.reach_names:
-                    raise ValueError(f"Reach '{q.reach_name}' was not found.")
-                else:
-                    found_topo_id_in_reach = False
-                    for reach in self._reaches:
-                        if found_topo_id_in_reach:
-                            break
-                        # Look for the targeted reach
-                        if q.reach_name != reach.ReachId:
-                            continue
-                        # Raise an error if the combination reach and topo-id does not exist
-                        topoid_names_in_reach = self._topoid_in_reach(self, reach)
-                        if q.topoid_name not in topoid_names_in_reach:
-                            raise ValueError(
-                                f"Topo-ID '{q.topoid_name}' was not found in reach '{q.reach_name}'."
-                            )
-                        found_topo_id_in_reach = True
-            if q.chainage is not None:
-                found_chainage = False
-                for reach in self._reaches:
-                    if found_chainage:
-                        break
-                    # Look for the targeted combination reach and topo-id
-                    if q.reach_name != reach.ReachId and q.topoid_name != reach.TopoId:
-                        continue
-                    for chainage in self._chainages(reach):
-                        # Look for the targeted chainage
-                        chainage_diff = chainage - q.chainage
-                        if abs(chainage_diff) < chainage_tolerance:
-                            found_chainage = True
-                            break
-                if not found_chainage:
-                    raise ValueError(
-                        f"Chainage {q.chainage} was not found in reach '{q.reach_name}' for Topo-ID '{q.topoid_name}'."
-                    )
+            self._validate_query(q, chainage_tolerance)
+
+    def _query_reach_indices(self, q) -> list[int]:
+        """Return the indices of the reaches matching the topo-id and reach name of a query."""
+        if q.reach_name is not None:  # When reach_name is set
+            reach_entry = self._reach_by_key.get((q.reach_name, q.topoid_name))
+            return [reach_entry[0]] if reach_entry is not None else []
+        return self._reach_indices_by_topoid.get(q.topoid_name, [])
 
     def _build_queries(self, queries):
-        warn("The '_build_queries' method is deprecated. Use '.xsections' instead.")
+        _deprecate("The '_build_queries' method is deprecated. Use '.xsections' instead.")
+        self._build_reach_index()
         built_queries = []
         for q in queries:
             # e.g. QueryData("topoid1", "reach1", 58.68)
@@ -273,75 +467,121 @@ class Xns11(CrossSectionCollection):
                 built_queries.append(q)
                 continue
             # e.g QueryData("topoid1", "reach1") or QueryData("topoid1")
-            q_topoid_name = q.topoid_name
-            q_reach_name = q.reach_name
-            for reach, reach_name in zip(self._reaches, self.reach_names):
-                if q_reach_name is not None:  # When reach_name is set
-                    if reach_name != q_reach_name:
-                        continue
-                topoid_in_reach = self._topoid_in_reach(self, reach)
-                if q.topoid_name not in topoid_in_reach:
-                    continue
-                for curr_chain in self._chainages(reach):
-                    if reach.TopoId == q.topoid_name:
-                        chainage = curr_chain
-                    else:
-                        continue
-
-                    q = QueryData(q_topoid_name, reach_name, round(chainage, 3))
-                    built_queries.append(q)
+            topoid_name = q.topoid_name
+            for reach_idx in self._query_reach_indices(q):
+                reach_name = self._reach_ids[reach_idx]
+                chainages, _ = self._cached_chainages(reach_idx)
+                built_queries.extend(
+                    QueryData._from_validated(topoid_name, reach_name, round(chainage, 3))
+                    for chainage in chainages
+                )
         return built_queries
 
-    def _find_points(self, queries, chainage_tolerance=0.1):
-        warn("The '_find_points' method is deprecated. Use '.xsections' instead.")
-        PointInfo = namedtuple("PointInfo", ["index", "value"])
+    def _append_point(self, found_points, reach_idx, topoid_name, chainage, chainage_tolerance):
+        """Append the _Point of a reach at the given chainage to found_points, if it exists."""
+        # idx is the index of the first chainage found in the topoid
+        idx = self._find_chainage_index(reach_idx, chainage, chainage_tolerance)
+        if idx is None:
+            return
+        found_points.append(self._make_point(reach_idx, topoid_name, idx, chainage))
+
+    def _make_point(self, reach_idx, topoid_name, chainage_idx, chainage) -> _Point:
+        """Create the _Point of a chainage of a reach, given its first chainage index in tolerance.
+
+        The cross section of the point is the one nearest to the chainage, like the one found by
+        FindClosestCrossSection, as several cross sections can be within the tolerance.
+        """
+        reach_name = self._reach_ids[reach_idx]
+        topoid_idx = self._topoid_position_in_reach[(reach_name, topoid_name)]
+        xsection_idx = self._find_nearest_chainage_index(reach_idx, chainage, chainage_idx)
+        _, cross_sections = self._cached_chainages(reach_idx)
+        xsection = cross_sections[xsection_idx]
+        return _Point(
+            (chainage_idx, chainage),
+            (reach_idx, reach_name),
+            (topoid_idx, topoid_name),
+            (xsection_idx, xsection),
+        )
+
+    def _append_reach_points(self, found_points, reach_idx, topoid_name):
+        """Append a _Point for every cross section of a reach to found_points.
+
+        The chainages of the points are rounded like the queries made by _build_queries.
+        """
+        chainages, cross_sections = self._cached_chainages(reach_idx)
+        reach = (reach_idx, self._reach_ids[reach_idx])
+        topoid = (self._topoid_position_in_reach[(reach[1], topoid_name)], topoid_name)
+        for idx, chainage in enumerate(chainages):
+            found_points.append(
+                _Point((idx, round(chainage, 3)), reach, topoid, (idx, cross_sections[idx]))
+            )
 
-        found_points = defaultdict(list)
+    def _find_points(self, queries, chainage_tolerance=0.1):
+        _deprecate("The '_find_points' method is deprecated. Use '.xsections' instead.")
+        self._build_reach_index()
+        found_points = []
         # Find the points given its topo-id, reach, and chainage
         for q in queries:
-            for reach_idx, curr_reach in enumerate(self._reaches):
-                # Look for the targed reach and topo-id
-                if q.reach_name != curr_reach.ReachId or q.topoid_name != curr_reach.TopoId:
-                    continue
-                reach_info = PointInfo(reach_idx, q.reach_name)
-                topo_pair = self._topoid_in_reach(self, curr_reach)
-                for topoid_reach_idx, topoid_reach in enumerate(topo_pair):
-                    if q.topoid_name != topoid_reach:
-                        continue
-                    topoid_info = PointInfo(topoid_reach_idx, topoid_reach)
-                    for idx, curr_chain in enumerate(self._chainages(curr_reach)):
-                        # Look for the targed chainage
-                        chainage_diff = curr_chain - q.chainage
-                        is_chainage = abs(chainage_diff) < chainage_tolerance
-                        if not is_chainage:
-                            continue
-                        # idx is the index in the topoid
-                        chainage_info = PointInfo(idx, q.chainage)
-                        found_points["chainage"].append(chainage_info)
-                        found_points["topoid"].append(topoid_info)
-                        found_points["reach"].append(reach_info)
-                        break  # Break at the first chainage found.
-
-        return dict(found_points)
-
-    def read(self, queries):
+            # Look for the targed reach and topo-id
+            reach_entry = self._reach_by_key.get((q.reach_name, q.topoid_name))
+            if reach_entry is None:
+                continue
+            reach_idx, _ = reach_entry
+            self._append_point(
+                found_points, reach_idx, q.topoid_name, q.chainage, chainage_tolerance
+            )
+
+        if not found_points:
+            return {}
+        return {
+            "chainage": [_PointInfo(*point.chainage) for point in found_points],
+            "topoid": [_PointInfo(*point.topoid) for point in found_points],
+            "reach": [_PointInfo(*point.reach) for point in found_points],
+            "xsection": [_PointInfo(*point.xsection) for point in found_points],
+        }
+
+    def _resolve_queries(self, queries, chainage_tolerance=0.1):
+        """Validate the queries and find the points they refer to in a single pass.
+
+        Finds the same cross sections as calling _validate_queries, _build_queries and _find_points
+        in turn, as a single list of _Point objects.
+        """
+        self._build_reach_index()
+        found_points = []
+        for q in queries:
+            reach_idx, chainage_idx = self._validate_query(q, chainage_tolerance)
+            # e.g. QueryData("topoid1", "reach1", 58.68)
+            if chainage_idx is not None:
+                # The single point of a fully specified query was already found by validation.
+                point = self._make_point(reach_idx, q.topoid_name, chainage_idx, q.chainage)
+                found_points.append(point)
+                continue
+            # e.g QueryData("topoid1", "reach1") or QueryData("topoid1")
+            for reach_idx in self._query_reach_indices(q):
+                self._append_reach_points(found_points, reach_idx, q.topoid_name)
+
+        return found_points
+
+    def read(self, queries, legacy_columns=True):
         """Read the requested data from the xns11 file and return a Pandas DataFrame.
 
         Parameters
         ----------
         queries: list
             `QueryData` objects that define the requested data.
+        legacy_columns: bool, optional
+            If True (default), columns are named like 'x topoid1 reach1 58.68'.
+            If False, columns are a MultiIndex with the levels
+            'coordinate', 'topoid_name', 'reach_name' and 'chainage'.
 
         Returns
         -------
         pd.DataFrame
 
         """
-        warn("The 'read' method is deprecated. See documentation for new API.")
-        self._validate_queries(queries)
-        built_queries = self._build_queries(queries)
-        found_points = self._find_points(built_queries)
-        df = self._get_data(found_points)
+        _deprecate("The 'read' method is deprecated. See documentation for new API.")
+        found_points = self._resolve_queries(queries)
+        df = self._get_point_values(found_points, legacy_columns=legacy_columns)
         return df
 
     # endregion
@@ -370,14 +610,16 @@ def open(file_path: str | Path) -> Xns11:
     --------
     >>> with open("file.xns11") as x11:
     >>>     print(x11.topoid_names)
-    ['topoid1', 'topoid2']
+    ('topoid1', 'topoid2')
 
     """
-    warn("The 'xns11.open' method is deprecated. Use 'mikeio1d.open' instead.")
-    return Xns11(file_path)
+    _deprecate("The 'xns11.open' method is deprecated. Use 'mikeio1d.open' instead.")
+    return Xns11._from_path(Path(file_path))
 
 
-def read(file_path: str | Path, queries: QueryData | list[QueryData]) -> pd.DataFrame:
+def read(
+    file_path: str | Path, queries: QueryData | list[QueryData], legacy_columns=True
+) -> pd.DataFrame:
     """Read the requested data from the xns11 file and return a Pandas DataFrame.
 
     Parameters
@@ -386,16 +628,18 @@ def read(file_path: str | Path, queries: QueryData | list[QueryData]) -> pd.Data
         full path and file name to the xns11 file.
     queries: a single query or a list of queries
         `QueryData` objects that define the requested data.
+    legacy_columns: bool, optional
+        If True (default), columns are flat strings. If False, columns are a MultiIndex.
+        See `Xns11.read`.
 
     Returns
     -------
     pd.DataFrame
 
     """
-    warn("The 'xns11.read' method is deprecated. See documentation for new API.")
+    _deprecate("The 'xns11.read' method is deprecated. See documentation for new API.")
     queries = queries if isinstance(queries, list) else [queries]
-    with open(file_path) as xns11:
-        return xns11.read(queries)
+    return Xns11._from_path(Path(file_path)).read(queries, legacy_columns=legacy_columns)
 
 
 class QueryData:
@@ -418,13 +662,24 @@ class QueryData:
 
     """
 
+    __slots__ = ("_topoid_name", "_reach_name", "_chainage")
+
     def __init__(self, topoid_name, reach_name=None, chainage=None):
-        warn("The 'QueryData' class is deprecated. See documentation for new API.")
+        _deprecate("The 'QueryData' class is deprecated. See documentation for new API.")
         self._topoid_name = topoid_name
         self._reach_name = reach_name
         self._chainage = chainage
         self._validate()
 
+    @classmethod
+    def _from_validated(cls, topoid_name, reach_name=None, chainage=None):
+        """Create a query from values that are known to be valid, skipping validation."""
+        query = cls.__new__(cls)
+        query._topoid_name = topoid_name
+        query._reach_name = reach_name
+        query._chainage = chainage
+        return query
+
     def _validate(self):
         tp = self.topoid_name
         rn = self.reach_name
@@ -1,10 +1,13 @@
+import io
 import os
 import shutil
 import urllib.request
 import zipfile
 import platform
+import re
 
-from glob import glob
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from pathlib import Path
 
 
@@ -23,7 +26,6 @@ class NuGetPackageInfo:
         self.path = path
 
         self.dir_name = f"{path}/{nuget}/{name}.{version}"
-        self.zip_name = f"{path}/{nuget}/{name}.{version}.zip"
         self.link = f"{self.root}{name}/{version}"
 
 
@@ -41,6 +43,15 @@ class NuGetRetriever:
     # Directory where libraries will be installed
     bin_dir_name = os.path.join("mikeio1d", "bin")
 
+    # File in the nuget directory listing the packages installed into bin
+    installed_file_name = "installed.txt"
+
+    # Library in bin that must exist for the packages to count as installed
+    sentinel_file_name = "DHI.Mike1D.ResultDataAccess.dll"
+
+    # Environment variable which, when set, forces packages to be installed again
+    force_reinstall_variable = "MIKEIO1D_FORCE_REINSTALL"
+
     # Default version of DHI NuGet packages to retrieve
     version_default = "22.0.3"
 
@@ -78,24 +89,36 @@ class NuGetRetriever:
     }
 
     # Files with these extensions copy
-    extensions = ["*.dll", "*.pfs", "*.ubg", "*.xml", "*.so", "*.so.5"]
+    extensions = (".dll", ".pfs", ".ubg", ".xml", ".so", ".so.5")
+
+    # Number of packages downloaded and extracted concurrently
+    max_workers = 8
 
-    def __init__(self, path=path_default, version=version_default):
+    # Size of the chunks packages are read in while downloading
+    download_chunk_size = 1024 * 1024
+
+    def __init__(self, path=path_default, version=version_default, force=False):
         self.path = path
         self.version = version
+        # Download packages again even if they are already extracted
+        self.force = force
+        # Matches any of the builds to include for this platform
+        builds = self.include_builds[platform.system()]
+        self.build_pattern = re.compile("|".join(re.escape(build) for build in builds))
 
     def install_packages(self):
         self.refine_package_names_list()
         self.create_nuget_dir_if_needed()
         self.generate_package_infos()
         self.download_packages()
-        self.extract_packages()
         self.copy_packages_to_bin()
+        self.write_installed_file()
 
     def refine_package_names_list(self):
         is_linux = platform.system() == "Linux"
         if is_linux:
-            self.package_names += self.package_names_linux
+            # Creates an instance list, so the class list is not extended on every call
+            self.package_names = NuGetRetriever.package_names + self.package_names_linux
 
     def create_nuget_dir_if_needed(self):
         path = os.path.join(self.path, self.nuget_dir_name)
@@ -117,17 +140,54 @@ class NuGetRetriever:
         nuget_dir = os.path.join(self.path, self.nuget_dir_name)
         print(f"  Downloading DHI NuGet packages into: {nuget_dir}")
 
+        package_infos = []
         for info in self.package_infos:
-            print(f"    Downloading package: {info.name} {info.version}")
-            urllib.request.urlretrieve(info.link, info.zip_name)
-
-    def extract_packages(self):
-        version = self.version
-
-        for info in self.package_infos:
-            with zipfile.ZipFile(info.zip_name, "r") as zip_ref:
-                extract_dir = os.path.join(".", info.dir_name)
-                zip_ref.extractall(extract_dir)
+            if not self.force and os.path.isdir(info.dir_name):
+                print(f"    Package already extracted: {info.name} {info.version}")
+                continue
+            package_infos.append(info)
+
+        # Downloads are dominated by network latency, so they are done concurrently,
+        # sharing one opener between the workers. Each package is extracted as soon as it is
+        # downloaded, in a separate pool sized for the CPU bound decompression.
+        opener = urllib.request.build_opener()
+        max_workers = max(1, min(len(package_infos), self.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as downloader, ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as extractor:
+            downloads = {
+                downloader.submit(self.download_package, info, opener): info
+                for info in package_infos
+            }
+            extractions = []
+            for future in as_completed(downloads):
+                package = future.result()
+                info = downloads[future]
+                print(f"    Downloaded package: {info.name} {info.version}")
+                extractions.append(extractor.submit(self.extract_package, info, package))
+            for future in as_completed(extractions):
+                future.result()
+
+    def download_package(self, info, opener):
+        """Downloads a package into memory, without writing the zip to disk."""
+        package = io.BytesIO()
+        with opener.open(info.link) as response:
+            shutil.copyfileobj(response, package, length=self.download_chunk_size)
+        package.seek(0)
+        return package
+
+    def extract_package(self, info, package):
+        with zipfile.ZipFile(package, "r") as zip_ref:
+            # Only the files that will be copied to bin are extracted.
+            members = [name for name in zip_ref.namelist() if self.is_file_to_copy(name)]
+            # Extract next to the package directory and rename it when done, so an interrupted
+            # extraction is not mistaken for an extracted package on the next install.
+            partial_dir = Path(f"{info.dir_name}.partial")
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            partial_dir.mkdir(parents=True)
+            zip_ref.extractall(partial_dir, members=members)
+        shutil.rmtree(info.dir_name, ignore_errors=True)
+        os.replace(partial_dir, info.dir_name)
 
     def copy_packages_to_bin(self):
         destination = os.path.join(self.path, self.bin_dir_name)
@@ -135,13 +195,44 @@ class NuGetRetriever:
         print(f"  Copying DHI NuGet packages into: {destination}")
 
         files = self.create_file_list_to_copy()
+        os.makedirs(destination, exist_ok=True)
 
+        # Files with the same name from several builds are copied once, preferring the build
+        # listed first in include_builds, and otherwise the file found last.
+        copies = {}
         for source_file in files:
-            source_file_path_stripped = self.strip_source_file_path(source_file)
-            print(f"    Copying file: {source_file_path_stripped}")
             _, file_name = os.path.split(source_file)
             destination_file = os.path.join(destination, file_name)
-            shutil.copy2(source_file, destination_file)
+            current_file = copies.get(destination_file)
+            if current_file is None or self.build_rank(source_file) <= self.build_rank(
+                current_file
+            ):
+                copies[destination_file] = source_file
+
+        # File metadata is not needed for the copies, so copyfile is used over copy2.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for destination_file, source_file in copies.items():
+                source_file_path_stripped = self.strip_source_file_path(source_file)
+                if self.is_copy_up_to_date(source_file, destination_file):
+                    print(f"    File up to date: {source_file_path_stripped}")
+                    continue
+                print(f"    Copying file: {source_file_path_stripped}")
+                futures.append(executor.submit(shutil.copyfile, source_file, destination_file))
+            for future in as_completed(futures):
+                future.result()
+
+    @staticmethod
+    def is_copy_up_to_date(source_file, destination_file):
+        """Checks if destination_file is a copy of source_file made after it was last modified."""
+        if not os.path.exists(destination_file):
+            return False
+        source_stat = os.stat(source_file)
+        destination_stat = os.stat(destination_file)
+        return (
+            source_stat.st_size == destination_stat.st_size
+            and source_stat.st_mtime <= destination_stat.st_mtime
+        )
 
     def strip_source_file_path(self, file_path):
         path = Path(file_path)
@@ -155,32 +246,62 @@ class NuGetRetriever:
         return path_stripped
 
     def create_file_list_to_copy(self):
-        start_dir = os.path.join(self.path, self.nuget_dir_name)
-        extensions = self.extensions
         files = []
 
-        for directory, _, _ in os.walk(start_dir):
-            for extension in extensions:
-                file_candidates = glob(os.path.join(directory, extension))
-
-                for file_candidate in file_candidates:
-                    if not self.check_file_candidate(file_candidate):
+        # Only the directories of the requested packages are walked, so packages of other
+        # versions left in the nuget directory are neither scanned nor copied.
+        for info in self.package_infos:
+            for directory, _, file_names in os.walk(info.dir_name):
+                for file_name in file_names:
+                    file_candidate = os.path.join(directory, file_name)
+                    if not self.is_file_to_copy(file_candidate):
                         continue
 
                     files.append(file_candidate)
 
         return files
 
-    def check_file_candidate(self, file_candidate):
-        include_file = False
+    def is_file_to_copy(self, file_path):
+        # normcase makes the extension check case insensitive on Windows, as glob is.
+        has_extension = os.path.normcase(file_path).endswith(self.extensions)
+        return has_extension and self.check_file_candidate(file_path)
+
+    def build_rank(self, file_path):
+        """Position in include_builds of the first build that file_path belongs to."""
         builds = self.include_builds[platform.system()]
-        for build in builds:
-            if build in file_candidate:
-                include_file = True
-        return include_file
+        for rank, build in enumerate(builds):
+            if build in file_path:
+                return rank
+        return len(builds)
+
+    def check_file_candidate(self, file_candidate):
+        return self.build_pattern.search(file_candidate) is not None
+
+    def installed_file_contents(self):
+        return "".join(f"{info.name} {info.version}\n" for info in self.package_infos)
+
+    def write_installed_file(self):
+        installed_file = os.path.join(self.path, self.nuget_dir_name, self.installed_file_name)
+        with open(installed_file, "w") as f:
+            f.write(self.installed_file_contents())
+
+    def is_installed(self):
+        """Checks if the requested packages were the last ones installed into bin."""
+        self.refine_package_names_list()
+        self.generate_package_infos()
+
+        sentinel_file = os.path.join(self.path, self.bin_dir_name, self.sentinel_file_name)
+        if not os.path.exists(sentinel_file):
+            return False
+
+        installed_file = os.path.join(self.path, self.nuget_dir_name, self.installed_file_name)
+        if not os.path.exists(installed_file):
+            return False
+        with open(installed_file) as f:
+            return f.read() == self.installed_file_contents()
 
     @staticmethod
-    def install(version=version_default):
+    def install(version=version_default, force=False):
         """Installs NuGet packages into mikeio1d/bin folder"""
         cwd = os.getcwd()
         path, _ = os.path.split(os.path.join(cwd, __file__))
@@ -188,7 +309,12 @@ class NuGetRetriever:
 
         print("Installing DHI NuGet packages:")
 
-        retriever = NuGetRetriever(path, version)
-        retriever.install_packages()
+        force = force or bool(os.environ.get(NuGetRetriever.force_reinstall_variable))
+        retriever = NuGetRetriever(path, version, force)
+        if not force and retriever.is_installed():
+            print("  DHI NuGet packages are already installed, skipping.")
+            print(f"  Set {NuGetRetriever.force_reinstall_variable}=1 to install them again.")
+        else:
+            retriever.install_packages()
 
         print()
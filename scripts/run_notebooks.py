@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import os
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List
 
 from pathlib import Path
 
 import nbformat
 from nbconvert.preprocessors import ExecutePreprocessor
+from nbformat.v4.rwbase import rejoin_lines
+from nbformat.v4.rwbase import strip_transient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Matches stream outputs that count as warnings
+WARNING_PATTERN = re.compile("warning", re.IGNORECASE)
+
+# Directories that never contain notebooks of the repository
+SKIPPED_DIRECTORIES = {".git", ".venv", "node_modules", "_build", "site", ".ipynb_checkpoints"}
 
 
 def find_notebooks() -> List[Path]:
@@ -13,11 +32,29 @@ def find_notebooks() -> List[Path]:
     Find all jupyter notebooks in the repository.
     """
     notebooks = []
-    for file in Path(".").rglob("*.ipynb"):
-        notebooks.append(file)
+    directories = ["."]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRECTORIES:
+                        directories.append(entry.path)
+                elif entry.name.endswith(".ipynb"):
+                    notebooks.append(Path(entry.path))
     return notebooks
 
 
+@lru_cache(maxsize=None)
+def execute_preprocessor() -> ExecutePreprocessor:
+    """
+    The preprocessor used to execute all notebooks.
+
+    It starts a fresh kernel for every notebook, so that notebooks do not share state
+    and each one reports its own warnings.
+    """
+    return ExecutePreprocessor(timeout=600, kernel_name="python3", allow_errors=True, log_level=50)
+
+
 def run_notebook(notebook_path: Path):
     """
     Run a jupyter notebook.
@@ -25,20 +62,35 @@ def run_notebook(notebook_path: Path):
     Returns:
         The executed notebook object
     """
-    with open(notebook_path) as f:
-        nb = nbformat.read(f, as_version=4)
-        ep = ExecutePreprocessor(
-            timeout=600, kernel_name="python3", allow_errors=True, log_level=50
-        )
-        try:
-            ep.preprocess(nb, {"metadata": {"path": notebook_path.parent}})
-        except Exception as e:
-            print(f"Error executing the notebook {notebook_path}")
-            print(e)
+    nb = read_notebook(notebook_path.read_bytes())
+
+    ep = execute_preprocessor()
+    try:
+        ep.preprocess(nb, {"metadata": {"path": notebook_path.parent}})
+    except Exception as e:
+        print(f"Error executing the notebook {notebook_path}")
+        print(e)
 
     return nb
 
 
+def read_notebook(data: bytes):
+    """
+    Read a jupyter notebook from the bytes of its file, as version 4.
+
+    Uses orjson to parse version 4 notebooks when it is installed, and nbformat otherwise.
+    """
+    if orjson is not None:
+        nb_dict = orjson.loads(data)
+        if nb_dict.get("nbformat") == 4:
+            # The steps nbformat takes to read a version 4 notebook, apart from validation.
+            nb = nbformat.from_dict(nb_dict)
+            nb = rejoin_lines(nb)
+            return strip_transient(nb)
+
+    return nbformat.reads(data.decode("utf-8"), as_version=4)
+
+
 def strip_metadata(nb):
     """
     Strip the metadata from the notebook.
@@ -62,15 +114,15 @@ def count_errors_and_warnings(nb):
     Returns:
         The number of errors and warnings as a tuple (errors, warnings).
     """
-    errors = 0
-    warnings = 0
-    for cell in nb.cells:
-        if cell.cell_type == "code":
-            for output in cell.outputs:
-                if output.output_type == "error":
-                    errors += 1
-                elif output.output_type == "stream" and "warning" in output.text.lower():
-                    warnings += 1
+    outputs = [
+        output for cell in nb.cells if cell.cell_type == "code" for output in cell.outputs
+    ]
+    errors = sum(1 for output in outputs if output.output_type == "error")
+    warnings = sum(
+        1
+        for output in outputs
+        if output.output_type == "stream" and WARNING_PATTERN.search(output.text)
+    )
     return errors, warnings
 
 
@@ -86,18 +138,32 @@ def save_notebook(nb, notebook_path: Path):
         nbformat.write(nb, f)
 
 
+def process_notebook(notebook_path: Path):
+    """
+    Run, strip and save a jupyter notebook.
+
+    Returns:
+        The number of errors and warnings in the executed notebook as a tuple (errors, warnings).
+    """
+    nb = run_notebook(notebook_path)
+    nb = strip_metadata(nb)
+    save_notebook(nb, notebook_path)
+    return count_errors_and_warnings(nb)
+
+
 def main():
     summary = "\n\nSUMMARY OF ERRORS AND WARNINGS\n\n"
 
     total_errors = 0
     total_warnings = 0
 
-    for notebook_path in find_notebooks():
-        nb = run_notebook(notebook_path)
-        nb = strip_metadata(nb)
-        save_notebook(nb, notebook_path)
+    # Each notebook runs in its own kernel, so notebooks are run in parallel.
+    notebooks = find_notebooks()
+    max_workers = max(1, min(os.cpu_count() or 1, len(notebooks)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(process_notebook, notebooks))
 
-        errors, warnings = count_errors_and_warnings(nb)
+    for notebook_path, (errors, warnings) in zip(notebooks, results):
         total_errors += errors
         total_warnings += warnings
 
@@ -28,8 +28,22 @@ class UtilBuilder:
     # Files with these extensions to copy
     extensions = [".dll"]
 
-    def __init__(self, path=path_default):
+    # Source files of a library that require it to be rebuilt when changed
+    source_patterns = ["*.cs", "*.csproj"]
+
+    # Directories of a library with build output, not sources
+    output_dir_names = {"bin", "obj"}
+
+    # Directory with the libraries the projects reference, installed from NuGet
+    reference_dir_name = os.path.join("mikeio1d", "bin")
+
+    # Environment variable which, when set, forces libraries to be built again
+    force_reinstall_variable = "MIKEIO1D_FORCE_REINSTALL"
+
+    def __init__(self, path=path_default, force=False):
         self.path = path
+        # Build libraries even if they are up to date
+        self.force = force
 
     def build_libraries(self):
         print("  Building utility libraries:")
@@ -40,11 +54,41 @@ class UtilBuilder:
                 self.path, self.util_dir_name, library, project_file_name
             )
 
+            if not self.force and not self.needs_build(library):
+                print(f"    Project is up to date: {project_file_name}\n")
+                continue
+
             print(f"    Building project: {project_file_name}\n")
 
             command = ["dotnet", "build", "--configuration", "Release", project_file_path]
             subprocess.run(command)
 
+    def needs_build(self, library):
+        """Checks if the library has not been built, or has inputs newer than its build."""
+        library_dir = Path(self.path) / self.util_dir_name / library
+        output_file = library_dir / self.build_dir_name / (library + ".dll")
+        if not output_file.exists():
+            return True
+
+        output_mtime = output_file.stat().st_mtime
+        for input_file in self.build_input_files(library_dir):
+            if input_file.stat().st_mtime > output_mtime:
+                return True
+        return False
+
+    def build_input_files(self, library_dir):
+        """Yields the source files of a library and the referenced libraries it is built against."""
+        for pattern in self.source_patterns:
+            for source_file in library_dir.rglob(pattern):
+                relative_parts = source_file.relative_to(library_dir).parts
+                if relative_parts[0] in self.output_dir_names:
+                    continue
+                yield source_file
+
+        # Referenced libraries are replaced when other NuGet package versions are installed.
+        reference_dir = Path(self.path) / self.reference_dir_name
+        yield from reference_dir.glob("*.dll")
+
     def copy_libraries_to_bin(self):
         destination = os.path.join(self.path, self.bin_dir_name)
 
@@ -84,7 +128,8 @@ class UtilBuilder:
         path, _ = os.path.split(os.path.join(cwd, __file__))
         path = os.path.normpath(os.path.join(path, ".."))
 
-        util_builder = UtilBuilder(path)
+        force = bool(os.environ.get(UtilBuilder.force_reinstall_variable))
+        util_builder = UtilBuilder(path, force)
         util_builder.build_libraries()
         util_builder.copy_libraries_to_bin()
 
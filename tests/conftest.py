@@ -40,7 +40,7 @@ def helpers():
     return Helpers
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def flow_split_file_path():
     return testdata.flow_split_res1d
 
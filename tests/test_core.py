@@ -2,6 +2,9 @@ import pytest
 from .testdata import testdata
 
 from typing import List
+import dataclasses
+import functools
+import os
 import random
 
 from pandas.testing import assert_frame_equal
@@ -13,27 +16,40 @@ from mikeio1d.query import QueryData
 from mikeio1d.result_reader_writer.result_reader import ColumnMode
 
 
+RESULT_EXTENSIONS = (".res1d", ".res", ".resx", ".out")
+
+
+@functools.lru_cache(maxsize=1)
 def testdata_name():
-    import dataclasses
+    return tuple(field.name for field in dataclasses.fields(testdata))
+
+
+_PATHS_BY_EXT = {
+    extension: [
+        getattr(testdata, name)
+        for name in testdata_name()
+        if getattr(testdata, name).endswith(extension)
+    ]
+    for extension in RESULT_EXTENSIONS
+}
+
+_RESULT_PATHS = [path for paths in _PATHS_BY_EXT.values() for path in paths]
 
-    return list(dataclasses.asdict(testdata).keys())
+_RESULT_NAMES = [name for name in testdata_name() if getattr(testdata, name) in _RESULT_PATHS]
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("extension", [".res1d", ".res", ".resx", ".out"])
+@pytest.mark.parametrize("name", _RESULT_NAMES)
 @pytest.mark.parametrize("result_reader", ["copier", "query"])
-def test_mikeio1d_generates_expected_dataframe_for_filetype_read_all(result_reader, extension):
-    for name in testdata_name():
-        path = getattr(testdata, name)
-        if not path.endswith(extension):
-            continue
-        column_mode = ColumnMode.STRING if result_reader == "copier" else None
-        df = Res1D(path, result_reader_type=result_reader).read(column_mode=column_mode)
-        df = df.loc[
-            :, ~df.columns.duplicated()
-        ]  # TODO: Remove this when column names are guaranteed unique
-        df_expected = testdata.get_expected_dataframe(name)
-        assert_frame_equal(df, df_expected)
+def test_mikeio1d_generates_expected_dataframe_for_filetype_read_all(result_reader, name):
+    path = getattr(testdata, name)
+    column_mode = ColumnMode.STRING if result_reader == "copier" else None
+    df = Res1D(path, result_reader_type=result_reader).read(column_mode=column_mode)
+    df = df.loc[
+        :, ~df.columns.duplicated()
+    ]  # TODO: Remove this when column names are guaranteed unique
+    df_expected = testdata.get_expected_dataframe(name)
+    assert_frame_equal(df, df_expected)
 
 
 def sample_random_time_series_ids(res: Res1D) -> List[TimeSeriesId]:
@@ -50,50 +66,38 @@ def sample_random_queries(res: Res1D) -> List[str]:
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("extension", [".res1d", ".res", ".resx", ".out"])
+@pytest.mark.parametrize("path", _RESULT_PATHS, ids=os.path.basename)
 @pytest.mark.parametrize("result_reader", ["copier", "query"])
-def test_mikeio1d_generates_dataframe_reading_time_series_ids(result_reader, extension):
-    for name in testdata_name():
-        path = getattr(testdata, name)
-        if not path.endswith(extension):
-            continue
-        res = Res1D(path, result_reader_type=result_reader)
-        sample_tsids = sample_random_time_series_ids(res)
-        df = res.read(sample_tsids)
-        assert len(df) > 0
+def test_mikeio1d_generates_dataframe_reading_time_series_ids(result_reader, path):
+    res = Res1D(path, result_reader_type=result_reader)
+    sample_tsids = sample_random_time_series_ids(res)
+    df = res.read(sample_tsids)
+    assert len(df) > 0
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("extension", [".res1d", ".res", ".resx", ".out"])
+@pytest.mark.parametrize("path", _RESULT_PATHS, ids=os.path.basename)
 @pytest.mark.parametrize("result_reader", ["copier", "query"])
-def test_mikeio1d_generates_dataframe_reading_queries(result_reader, extension):
-    for name in testdata_name():
-        path = getattr(testdata, name)
-        if not path.endswith(extension):
-            continue
-        res = Res1D(path, result_reader_type=result_reader)
-        sample_queries = sample_random_queries(res)
-        df = res.read(sample_queries)
-        assert len(df) > 0
+def test_mikeio1d_generates_dataframe_reading_queries(result_reader, path):
+    res = Res1D(path, result_reader_type=result_reader)
+    sample_queries = sample_random_queries(res)
+    df = res.read(sample_queries)
+    assert len(df) > 0
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("extension", [".res1d", ".res", ".resx", ".out"])
+@pytest.mark.parametrize("path", _RESULT_PATHS, ids=os.path.basename)
 @pytest.mark.parametrize(
     "column_mode", [ColumnMode.ALL, ColumnMode.COMPACT, ColumnMode.TIMESERIES, ColumnMode.STRING]
 )
-def test_mikeio1d_all_column_modes_basic(extension, column_mode):
+def test_mikeio1d_all_column_modes_basic(path, column_mode):
     """Basic check that no errors are raised for reading in all column modes."""
-    for name in testdata_name():
-        path = getattr(testdata, name)
-        if not path.endswith(extension):
-            continue
-        res = Res1D(path)
-        sample_queries = sample_random_queries(res)
-        df = res.read(sample_queries, column_mode=column_mode)
-        assert len(df) > 0
-        df = res.read(column_mode=column_mode)
-        assert len(df) > 0
+    res = Res1D(path)
+    sample_queries = sample_random_queries(res)
+    df = res.read(sample_queries, column_mode=column_mode)
+    assert len(df) > 0
+    df = res.read(column_mode=column_mode)
+    assert len(df) > 0
 
 
 @pytest.mark.slow
@@ -115,14 +119,9 @@ def test_mikeio1d_all_column_modes_basic(extension, column_mode):
     ],
 )
 def test_mikeio1d_network_res1d_using_time_filters(time, helpers):
-    for name in testdata_name():
-        path = getattr(testdata, name)
-        if not path.endswith("network.res1d"):
-            continue
-
-        df = Res1D(path, time=time).read(column_mode=ColumnMode.STRING)
-        df_expected = testdata.get_expected_dataframe(name)
-        if len(df.index) != len(df_expected):
-            df_expected = df_expected.loc[df.index]
-        assert_frame_equal(df_expected, df)
+    df = Res1D(testdata.network_res1d, time=time).read(column_mode=ColumnMode.STRING)
+    df_expected = testdata.get_expected_dataframe("network_res1d")
+    if len(df.index) != len(df_expected):
+        df_expected = df_expected.loc[df.index]
+    assert_frame_equal(df_expected, df)
 
@@ -29,27 +29,39 @@ def xz_data():
     return create_xz_data()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def xns_basic():
+    """Shared by the tests of this module, which must not modify it."""
     return Xns11(testdata.xsections_xns11)
 
 
-@pytest.fixture
-def cs_dummy(xz_data) -> CrossSection:
-    x, z = xz_data
+def create_cs_dummy() -> CrossSection:
+    x, z = create_xz_data()
     return CrossSection.from_xz(
         x=x, z=z, location_id="my_location", chainage=100, topo_id="my_topo"
     )
 
 
+@pytest.fixture
+def cs_dummy() -> CrossSection:
+    return create_cs_dummy()
+
+
+@pytest.fixture(scope="module")
+def cs_dummy_ro() -> CrossSection:
+    """Shared by the tests of this module, which must not modify it. Use cs_dummy to modify."""
+    return create_cs_dummy()
+
+
 @pytest.fixture
 def cs_basic(xns_basic) -> CrossSection:
     return list(xns_basic.xsections.values())[0]
 
 
 @pytest.fixture
-def cs_sample(xns_basic) -> List[CrossSection]:
-    x = list(xns_basic.xsections.values())
+def cs_sample() -> List[CrossSection]:
+    # Tests modify these cross sections, so they are not taken from the shared xns_basic.
+    x = list(Xns11(testdata.xsections_xns11).xsections.values())
     x = x[::2]
     return x
 
@@ -66,38 +78,38 @@ class TestCrossSectionUnits:
         )
         assert isinstance(cs, CrossSection)
 
-    def test_topo_id(self, cs_dummy):
-        assert cs_dummy.topo_id == "my_topo"
+    def test_topo_id(self, cs_dummy_ro):
+        assert cs_dummy_ro.topo_id == "my_topo"
 
-    def test_location_id(self, cs_dummy):
-        assert cs_dummy.location_id == "my_location"
+    def test_location_id(self, cs_dummy_ro):
+        assert cs_dummy_ro.location_id == "my_location"
 
-    def test_chainage(self, cs_dummy):
-        assert cs_dummy.chainage == 100
+    def test_chainage(self, cs_dummy_ro):
+        assert cs_dummy_ro.chainage == 100
 
-    def test_bottom_level(self, cs_dummy):
-        assert cs_dummy.bottom_level == 10
+    def test_bottom_level(self, cs_dummy_ro):
+        assert cs_dummy_ro.bottom_level == 10
 
-    def test_height(self, cs_dummy):
-        assert cs_dummy.height == 10
+    def test_height(self, cs_dummy_ro):
+        assert cs_dummy_ro.height == 10
 
-    def test_interpolate(self, cs_dummy):
-        assert cs_dummy.interpolated is False
+    def test_interpolate(self, cs_dummy_ro):
+        assert cs_dummy_ro.interpolated is False
 
-    def test_is_open(self, cs_dummy):
-        assert cs_dummy.is_open is True
+    def test_is_open(self, cs_dummy_ro):
+        assert cs_dummy_ro.is_open is True
 
-    def test_max_width(self, cs_dummy):
-        assert cs_dummy.max_width == 100
+    def test_max_width(self, cs_dummy_ro):
+        assert cs_dummy_ro.max_width == 100
 
-    def test_min_water_depth(self, cs_dummy):
-        assert cs_dummy.min_water_depth == 0
+    def test_min_water_depth(self, cs_dummy_ro):
+        assert cs_dummy_ro.min_water_depth == 0
 
-    def test_zmax(self, cs_dummy):
-        assert cs_dummy.zmax == 20
+    def test_zmax(self, cs_dummy_ro):
+        assert cs_dummy_ro.zmax == 20
 
-    def test_zmin(self, cs_dummy):
-        assert cs_dummy.zmin == 10
+    def test_zmin(self, cs_dummy_ro):
+        assert cs_dummy_ro.zmin == 10
 
     def test_coords_get(self, cs_basic):
         coords = cs_basic.coords
@@ -122,15 +134,15 @@ class TestCrossSectionUnits:
         assert isinstance(geometry, CrossSectionGeometry)
         np.testing.assert_array_equal(geometry.coords, cs_basic.coords)
 
-    def test_resistance_type_get(self, cs_dummy):
-        assert cs_dummy.resistance_type == ResistanceType.RELATIVE
+    def test_resistance_type_get(self, cs_dummy_ro):
+        assert cs_dummy_ro.resistance_type == ResistanceType.RELATIVE
 
     def test_resistance_type_set(self, cs_dummy):
         cs_dummy.resistance_type = ResistanceType.MANNINGS_N
         assert cs_dummy.resistance_type == ResistanceType.MANNINGS_N
 
-    def test_resistance_distribution_get(self, cs_dummy):
-        assert cs_dummy.resistance_distribution == ResistanceDistribution.UNIFORM
+    def test_resistance_distribution_get(self, cs_dummy_ro):
+        assert cs_dummy_ro.resistance_distribution == ResistanceDistribution.UNIFORM
 
     def test_resistance_distribution_set(self, cs_dummy):
         cs_dummy.resistance_distribution = ResistanceDistribution.ZONES
@@ -171,8 +183,8 @@ class TestCrossSectionUnits:
         setattr(cs_dummy, zone, 2.0)
         assert getattr(cs_dummy, zone) == 2.0
 
-    def test_radius_type(self, cs_dummy):
-        assert cs_dummy.radius_type == RadiusType.RESISTANCE_RADIUS
+    def test_radius_type(self, cs_dummy_ro):
+        assert cs_dummy_ro.radius_type == RadiusType.RESISTANCE_RADIUS
 
     def test_radius_type_set(self, cs_dummy):
         cs_dummy.radius_type = RadiusType.HYDRAULIC_RADIUS_TOTAL_AREA
@@ -193,8 +205,8 @@ class TestCrossSectionUnits:
         cs_dummy.number_of_processing_levels = 10
         assert cs_dummy.number_of_processing_levels == 10
 
-    def test_processing_levels_method_get(self, cs_dummy):
-        assert cs_dummy.processing_levels_method == ProcessLevelsMethod.AUTOMATIC_LEVELS
+    def test_processing_levels_method_get(self, cs_dummy_ro):
+        assert cs_dummy_ro.processing_levels_method == ProcessLevelsMethod.AUTOMATIC_LEVELS
 
     def test_processing_levels_method_set(self, cs_dummy):
         automatic_levels = cs_dummy.processing_levels
@@ -208,31 +220,32 @@ class TestCrossSectionUnits:
         cs_dummy.processing_levels_method = ProcessLevelsMethod.USER_DEFINED_LEVELS
         assert cs_dummy.processing_levels_method == ProcessLevelsMethod.USER_DEFINED_LEVELS
 
-    def test_processing_levels_get(self, cs_dummy):
+    def test_processing_levels_get(self, cs_dummy_ro):
         DEFAULT_PROCESSING_LEVELS = 20
-        assert len(cs_dummy.processing_levels) == DEFAULT_PROCESSING_LEVELS
-        assert min(cs_dummy.processing_levels) == cs_dummy.zmin
-        assert max(cs_dummy.processing_levels) == cs_dummy.zmax
+        assert len(cs_dummy_ro.processing_levels) == DEFAULT_PROCESSING_LEVELS
+        assert min(cs_dummy_ro.processing_levels) == cs_dummy_ro.zmin
+        assert max(cs_dummy_ro.processing_levels) == cs_dummy_ro.zmax
 
     def test_processing_levels_set(self, cs_dummy):
         cs_dummy.processing_levels = [10, 15, 20]
         assert len(cs_dummy.processing_levels) == 3
 
-    def test_processed_allow_recompute_get(self, cs_dummy):
+    def test_processed_allow_recompute_get(self, cs_dummy_ro):
         DEFAULT_ALLOW_RECOMPUTE = True
-        assert cs_dummy.processed_allow_recompute is DEFAULT_ALLOW_RECOMPUTE
+        assert cs_dummy_ro.processed_allow_recompute is DEFAULT_ALLOW_RECOMPUTE
 
     def test_processed_allow_recompute_set(self, cs_dummy):
         cs_dummy.processed_allow_recompute = False
         assert cs_dummy.processed_allow_recompute is False
 
-    def test_calculate_conveyance_factor(self, cs_dummy):
-        df = cs_dummy.processed
+    def test_calculate_conveyance_factor(self, cs_dummy_ro):
+        df = cs_dummy_ro.processed
         resistance, flow_area, radius = df.resistance, df.flow_area, df.radius
-        conveyances = tuple(
-            r * A * R ** (2.0 / 3) for r, A, R in zip(resistance, flow_area, radius)
+        conveyances = (
+            resistance.to_numpy() * flow_area.to_numpy() * np.power(radius.to_numpy(), 2.0 / 3)
         )
-        np.testing.assert_array_equal(conveyances, df.conveyance_factor)
+        # The library computes element-wise with Python floats, so allow for last-digit differences.
+        np.testing.assert_allclose(conveyances, df.conveyance_factor, rtol=1e-12)
 
     def test_processed_get(self, cs_sample):
         for cs in cs_sample:
@@ -295,9 +308,9 @@ class TestCrossSectionUnits:
                 cs_dummy.processed.conveyance_factor, df.conveyance_factor
             )
 
-    def test_raw_get(self, cs_dummy, xz_data):
+    def test_raw_get(self, cs_dummy_ro, xz_data):
         x, z = xz_data
-        df = cs_dummy.raw
+        df = cs_dummy_ro.raw
         assert isinstance(df, pd.DataFrame)
         expected_columns = {
             "markers",
@@ -356,8 +369,8 @@ class TestCrossSectionUnits:
         assert cs_dummy.raw.markers.iloc[0] == ""
         assert cs_dummy.raw.markers.iloc[1] == str(Marker.LEFT_LEVEE_BANK.value)
 
-    def test_markers_get(self, cs_dummy):
-        markers = cs_dummy.markers
+    def test_markers_get(self, cs_dummy_ro):
+        markers = cs_dummy_ro.markers
         assert isinstance(markers, pd.DataFrame)
         expected_columns = {
             "marker",
@@ -373,7 +386,7 @@ class TestCrossSectionUnits:
             Marker.RIGHT_LEVEE_BANK.value,
         } == set(markers.marker)
 
-        df: pd.DataFrame = cs_dummy.raw
+        df: pd.DataFrame = cs_dummy_ro.raw
         df = df[df.markers != ""]
         df = df[["markers", "marker_labels", "x", "z"]]
         df = df.rename(columns={"markers": "marker", "marker_labels": "marker_label"})
@@ -418,8 +431,8 @@ class TestCrossSectionUnits:
             (100, 20, 10),
         ],
     )
-    def test_find_nearest_point_index(self, cs_dummy, x, z, expected_index):
-        index = cs_dummy._find_nearest_point_index(x, z)
+    def test_find_nearest_point_index(self, cs_dummy_ro, x, z, expected_index):
+        index = cs_dummy_ro._find_nearest_point_index(x, z)
         assert index == expected_index
 
     def test_plot(self, cs_dummy):
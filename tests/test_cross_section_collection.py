@@ -224,6 +224,14 @@ class TestCrossSectionCollectionUnits:
         xs = df.cross_section.iloc[0]
         assert xs == xs_expected
 
+    def test_to_dataframe_after_modification(self, many_dummy_cross_sections):
+        csc = CrossSectionCollection(many_dummy_cross_sections[:3])
+        assert len(csc.to_dataframe()) == 3
+        csc.remove(many_dummy_cross_sections[0])
+        assert len(csc.to_dataframe()) == 2
+        csc.add(many_dummy_cross_sections[3])
+        assert len(csc.to_dataframe()) == 3
+
     @pytest.mark.optional_dependency
     def test_to_geopandas(self, many_real_cross_sections):
         pytest.importorskip("geopandas")
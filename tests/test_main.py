@@ -15,3 +15,17 @@ def test_open_xns11():
     """Test that the open function can open a xns11 file."""
     xns = mikeio1d.open("tests/testdata/xsections.xns11")
     assert isinstance(xns, mikeio1d.Xns11)
+
+
+def test_open_unsupported_extension(tmp_path):
+    """Test that the open function raises an error for unsupported file extensions."""
+    file_path = tmp_path / "file.txt"
+    file_path.touch()
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        mikeio1d.open(file_path)
+
+
+def test_open_missing_file(tmp_path):
+    """Test that the open function raises an error for files that do not exist."""
+    with pytest.raises(FileNotFoundError):
+        mikeio1d.open(tmp_path / "missing.res1d")
@@ -29,6 +29,11 @@ def test_file_does_not_exist():
         assert Res1D("tests/testdata/not_a_file.res1d")
 
 
+def test_unknown_result_reader_type(test_file_path):
+    with pytest.raises(ValueError):
+        Res1D(test_file_path, result_reader_type="unknown")
+
+
 def test_read(test_file):
     df = test_file.read()
     assert len(df) == 110
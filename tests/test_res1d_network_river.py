@@ -313,6 +313,23 @@ def test_res1d_modification_filtered(test_file, column_mode, expected_exception)
     assert pytest.approx(max_value_mod) == max_value_velocity
 
 
+def test_res1d_modification_unknown_time_stamp(test_file):
+    res1d = test_file
+    res1d.reader.column_mode = ColumnMode.ALL
+
+    df = res1d.read()
+    df_valid = df.iloc[:2]
+    # The unknown time stamp comes last, after values at valid time stamps could be written.
+    df_unknown = df.iloc[:1].set_axis(pd.DatetimeIndex(["2100-01-01"]))
+    df_modified = pd.concat([df_valid, df_unknown]).multiply(2.0)
+
+    with pytest.raises(KeyError):
+        res1d.modify(df_modified)
+
+    # TimeData is left unmodified at the valid time stamps.
+    pd.testing.assert_frame_equal(res1d.read().iloc[:2], df_valid)
+
+
 def test_extraction_to_csv_dfs0_txt(test_file):
     res1d = test_file
     res1d.read()
@@ -1,5 +1,9 @@
+import warnings
+
+import pandas as pd
 import pytest
 
+from mikeio1d.cross_sections import CrossSection
 from mikeio1d.xns11 import read, Xns11, QueryData
 
 
@@ -87,6 +91,27 @@ def test_read_bad_queries(file):
         read(file, [QueryData("topoid1", "reach1", 666)])
     assert "666" in str(excinfo.value)
 
+    # Existing reach and topo-id that do not occur together
+    with pytest.raises(ValueError) as excinfo:
+        read(file, [QueryData("topoid2", "reach1", 58.68)])
+    assert "Topo-ID 'topoid2' was not found in reach 'reach1'" in str(excinfo.value)
+
+    # Chainage that only exists on another reach with the same topo-id
+    with pytest.raises(ValueError) as excinfo:
+        read(file, [QueryData("topoid1", "reach1", 11150.42)])
+    assert "Chainage 11150.42 was not found in reach 'reach1'" in str(excinfo.value)
+
+
+def test_read_bad_query_after_valid_queries(file):
+    queries = [
+        QueryData("topoid1", "reach1", 58.68),
+        QueryData("topoid2", "reach2"),
+        QueryData("topoid1", "bad_reach_name"),
+    ]
+    with pytest.raises(ValueError) as excinfo:
+        read(file, queries)
+    assert "bad_reach_name" in str(excinfo.value)
+
 
 def test_read_multiple_queries(file):
     q1 = QueryData("topoid1", "reach1", 58.68)
@@ -112,6 +137,21 @@ def test_read_reach(file):
     ]
 
 
+def test_read_reach_multiindex_columns(file):
+    q_reach = QueryData("topoid2", "reach2")
+    geometry = read(file, [q_reach], legacy_columns=False)
+    assert list(geometry.columns.names) == ["coordinate", "topoid_name", "reach_name", "chainage"]
+    assert list(geometry.columns) == [
+        ("x", "topoid2", "reach2", -50.0),
+        ("z", "topoid2", "reach2", -50.0),
+        ("x", "topoid2", "reach2", 64.376),
+        ("z", "topoid2", "reach2", 64.376),
+        ("x", "topoid2", "reach2", 135.0),
+        ("z", "topoid2", "reach2", 135.0),
+    ]
+    assert geometry["z"].shape[1] == 3
+
+
 def test_read_multiple_reaches(file):
     q_reach1 = QueryData("topoid1", "reach3")
     q_reach4 = QueryData("topoid1", "reach4")
@@ -129,3 +169,145 @@ def test_read_all_topoid(file):
     geometry = read(file, [q_topoid2])
     assert len(geometry.columns) == 6
     assert geometry[geometry.columns[0]].count() == 4
+
+
+def test_read_after_removing_cross_section(file):
+    xns = Xns11(file)
+    geometry = xns.read([QueryData("topoid2", "reach2")])
+    assert len(geometry.columns) == 6
+
+    del xns["reach2", "64.376", "topoid2"]
+
+    geometry = xns.read([QueryData("topoid2", "reach2")])
+    assert list(geometry.columns) == [
+        "x topoid2 reach2 -50.0",
+        "z topoid2 reach2 -50.0",
+        "x topoid2 reach2 135.0",
+        "z topoid2 reach2 135.0",
+    ]
+
+
+def test_read_chainage_within_tolerance(file):
+    geometry = read(file, [QueryData("topoid1", "reach1", 58.7)])
+    assert list(geometry.columns) == ["x topoid1 reach1 58.7", "z topoid1 reach1 58.7"]
+    assert pytest.approx(round(geometry[geometry.columns[1]].min(), 3)) == 1626.16
+
+
+@pytest.fixture
+def xns_close_sections():
+    """Cross sections closer to each other than the chainage tolerance, e.g. at bridge faces."""
+    return Xns11(
+        [
+            CrossSection.from_xz([0, 10, 20], [5, 0, 5], "bridge", 1000.0, "topo"),
+            CrossSection.from_xz([0, 10, 20], [5, 1, 5], "bridge", 1000.05, "topo"),
+        ]
+    )
+
+
+@pytest.mark.parametrize("chainage,expected_bottom", [(1000.0, 0), (1000.05, 1), (1000.04, 1)])
+def test_read_nearest_of_close_cross_sections(xns_close_sections, chainage, expected_bottom):
+    geometry = xns_close_sections.read([QueryData("topo", "bridge", chainage)])
+    assert geometry[geometry.columns[1]].min() == expected_bottom
+
+
+def test_read_reach_of_close_cross_sections(xns_close_sections):
+    geometry = xns_close_sections.read([QueryData("topo", "bridge")])
+    assert list(geometry.columns) == [
+        "x topo bridge 1000.0",
+        "z topo bridge 1000.0",
+        "x topo bridge 1000.05",
+        "z topo bridge 1000.05",
+    ]
+    assert geometry["z topo bridge 1000.0"].min() == 0
+    assert geometry["z topo bridge 1000.05"].min() == 1
+
+
+def test_read_chainage_zero():
+    xns = Xns11(
+        [
+            CrossSection.from_xz([0, 10, 20], [5, 0, 5], "reach", 0, "topo"),
+            CrossSection.from_xz([0, 10, 20], [5, 1, 5], "reach", 100, "topo"),
+        ]
+    )
+    geometry = xns.read([QueryData("topo", "reach", 0)])
+    assert list(geometry.columns) == ["x topo reach 0", "z topo reach 0"]
+    assert geometry["z topo reach 0"].min() == 0
+
+
+def test_read_point_and_reach_on_same_reach(file):
+    q_point = QueryData("topoid2", "reach2", -50)
+    q_reach = QueryData("topoid2", "reach2")
+    geometry = read(file, [q_point, q_reach])
+    assert len(geometry.columns) == 8
+    assert geometry[geometry.columns[1]].min() == geometry[geometry.columns[3]].min()
+    assert pytest.approx(round(geometry[geometry.columns[1]].min(), 3)) == 1611.42
+
+
+def test_topoid_in_reach(file):
+    xns = Xns11(file)
+    for reach, reach_name, topoid_name in zip(xns._reaches, xns.reach_names, xns.topoid_names):
+        topoids = xns._topoid_in_reach(reach)
+        assert topoid_name in topoids
+        assert topoids == [t for r, t in zip(xns.reach_names, xns.topoid_names) if r == reach_name]
+
+
+def test_chainages(file):
+    xns = Xns11(file)
+    reach = next(r for r in xns._reaches if (r.ReachId, r.TopoId) == ("reach2", "topoid2"))
+    assert xns._chainages(reach) == pytest.approx([-50.0, 64.376, 135.0])
+
+
+def test_reach_and_topoid_names(file):
+    xns = Xns11(file)
+    assert {"topoid1", "topoid2"} <= set(xns.topoid_names)
+    assert len(xns.reach_names) == len(xns.topoid_names)
+    assert xns.reach_names is xns.reach_names
+
+    empty = Xns11()
+    assert empty.reach_names == ()
+    assert empty.topoid_names == ()
+
+
+def assert_read_matches_deprecated_steps(xns, queries):
+    xns._validate_queries(queries)
+    points = xns._find_points(xns._build_queries(queries))
+    # Without the cross sections found by _find_points, _get_values looks them up with
+    # FindClosestCrossSection like the deprecated steps originally did.
+    del points["xsection"]
+    expected = xns._get_values(points)
+    pd.testing.assert_frame_equal(xns.read(queries), expected)
+
+
+def test_read_matches_deprecated_steps(file):
+    xns = Xns11(file)
+    queries = [QueryData("topoid1", "reach1", 58.68), QueryData("topoid2")]
+    assert_read_matches_deprecated_steps(xns, queries)
+
+
+def test_read_close_cross_sections_matches_deprecated_steps(xns_close_sections):
+    queries = [QueryData("topo", "bridge", 1000.04), QueryData("topo", "bridge")]
+    assert_read_matches_deprecated_steps(xns_close_sections, queries)
+
+
+def test_find_points_point_info(file):
+    xns = Xns11(file)
+    points = xns._find_points([QueryData("topoid2", "reach2", 64.376)])
+    index, value = points["chainage"][0]
+    assert (index, value) == (1, 64.376)
+    assert points["chainage"][0] == (1, 64.376)
+
+
+def test_close(file):
+    xns = Xns11(file)
+    geometry = xns.read([QueryData("topoid2", "reach2")])
+    xns.close()
+    pd.testing.assert_frame_equal(xns.read([QueryData("topoid2", "reach2")]), geometry)
+
+
+def test_deprecation_warns_after_being_ignored(file):
+    xns = Xns11(file)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        xns.file
+    with pytest.warns(UserWarning, match="'file' property is deprecated"):
+        xns.file
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -49,9 +50,15 @@ class testdata:
     """A basic SWMM result file. Must have accompanying .inp file."""
 
     def get_expected_dataframe(self, name: str):
-        import pandas as pd
+        return _read_expected_dataframe(name).copy()
 
-        return pd.read_parquet(Path(__file__).parent / "expected_results" / f"{name}.parquet")
+
+@functools.lru_cache(maxsize=None)
+def _read_expected_dataframe(name: str):
+    """Read an expected result once per session. Use testdata.get_expected_dataframe for a copy."""
+    import pandas as pd
+
+    return pd.read_parquet(Path(__file__).parent / "expected_results" / f"{name}.parquet")
 
 
 testdata = testdata()
@@ -74,5 +81,6 @@ def generate_expected_results(output_folder: Path = Path(__file__).parent / "exp
         ]  # TODO: Remove this when column names are guaranteed unique
         output_path = output_folder / f"{name}.parquet"
         df.to_parquet(output_path)
+        _read_expected_dataframe.cache_clear()
         df_parquet = testdata.get_expected_dataframe(name)
         assert_frame_equal(df, df_parquet)
@@ -0,0 +1,29 @@
+﻿using System.Collections.Generic;
+using System.Linq;
+using DHI.Mike1D.CrossSectionModule;
+
+namespace DHI.Mike1D.MikeIO
+{
+  /// <summary>
+  /// Class which copies cross section point coordinates into arrays,
+  /// such that they can be transferred to Python in one bulk copy.
+  /// </summary>
+  public static class CrossSectionPointsCopier
+  {
+    /// <summary>
+    /// Creates an array with the X coordinates of the given cross section points.
+    /// </summary>
+    public static double[] GetXValues(IEnumerable<ICrossSectionPoint> points)
+    {
+      return points.Select(point => point.X).ToArray();
+    }
+
+    /// <summary>
+    /// Creates an array with the Z coordinates of the given cross section points.
+    /// </summary>
+    public static double[] GetZValues(IEnumerable<ICrossSectionPoint> points)
+    {
+      return points.Select(point => point.Z).ToArray();
+    }
+  }
+}